@@ -174,6 +174,7 @@ typedef struct {
     int keep_intermediate;                          /**< Keep intermediate processed images */
     int skip_audio_encoding;                        /**< 1 to skip SSTV audio encoding (overlay testing only) */
     int text_only;                                  /**< 1 to skip aspect ratio and resizing (only applies with -N) */
+    int json_summary;                               /**< 1 to print a one-line JSON summary as the last stdout line */
 
 } PisstvppConfig;
 
@@ -215,6 +216,7 @@ int pisstvpp_config_init(PisstvppConfig *config);
  * - `-v` Enable verbose output
  * - `-Z` Add timestamps to verbose output (implies -v)
  * - `-K` Keep intermediate processed images (debugging)
+ * - `-J` Print a one-line JSON summary of the written file (for test harnesses)
  * - `-h` Show help text
  *
  * @param config Pointer to PisstvppConfig structure to populate
@@ -221,6 +221,36 @@ static void verbose_print(int verbose_enabled, int add_timestamp, const char *fo
     va_end(args);
 }
 
+// ===========================================================================
+// JSON SUMMARY HELPER
+// ===========================================================================
+
+/**
+ * @brief Print the -J summary line describing the written audio file.
+ *
+ * Emits a single JSON object on its own line so callers (the test harness)
+ * can read the output properties without reopening the file:
+ * {"out":"<path>","fmt":"wav","sr":22050,"ch":1,"samples":N,"dur":117.439}
+ *
+ * Quotes, backslashes and control characters in the path are escaped.
+ */
+static void print_json_summary(const char *out, const char *fmt, int sample_rate,
+                               int channels, uint32_t sample_count) {
+    printf("{\"out\":\"");
+    for (const unsigned char *c = (const unsigned char *)out; *c; c++) {
+        if (*c == '"' || *c == '\\') {
+            printf("\\%c", *c);
+        } else if (*c < 0x20) {
+            printf("\\u%04x", *c);
+        } else {
+            putchar(*c);
+        }
+    }
+    printf("\",\"fmt\":\"%s\",\"sr\":%d,\"ch\":%d,\"samples\":%u,\"dur\":%.3f}\n",
+           fmt, sample_rate, channels, sample_count,
+           sample_count / (double)sample_rate);
+}
+
 // ===========================================================================
 // HELP TEXT DISPLAY
 // ===========================================================================
@@ -265,6 +295,7 @@ static void show_help(void) {
     printf("  -Z              Add timestamps to verbose logging (auto-enables -v, for log analysis)\n");
     printf("  -N              Skip audio encoding (test mode, for testing overlay without audio)\n");
     printf("  -O              Text-only overlay (skip resizing/aspect correction, requires -N)\n");
+    printf("  -J              Print a one-line JSON summary of the written file (for test harnesses)\n");
     printf("  -h              Display this help message\n\n");
     printf("CW SIGNATURE OPTIONS (optional):\n");
     printf("  -C <callsign>   Add CW signature with callsign (max 31 characters).\n");
@@ -832,6 +863,11 @@ int main(int argc, char *argv[]) {
         printf("Audio samples: %u (%.2f seconds at %d Hz)\n", sample_count, sample_count / (double)config.sample_rate, config.sample_rate);
         printf("Encoding time: %u millisecond%s\n", elapsed_ms, elapsed_ms == 1 ? "" : "s");
     }
+
+    if (config.json_summary) {
+        print_json_summary(config.output_file, config.format, config.sample_rate,
+                           CHANS, sample_count);
+    }
     
     return error_code;
 
@@ -108,6 +108,7 @@ int pisstvpp_config_init(PisstvppConfig *config) {
     config->timestamp_logging = 0;
     config->keep_intermediate = 0;
     config->text_only = 0;
+    config->json_summary = 0;
 
     return PISSTVPP2_OK;
 }
@@ -138,7 +139,7 @@ int pisstvpp_config_parse(PisstvppConfig *config, int argc, char *argv[]) {
     // Color bars: -R (color bar rows)
     // CW: -Q (CW tone frequency)
     // Testing: -N (skip audio encoding for overlay testing)
-    while ((option = getopt(argc, argv, "i:o:p:f:r:vC:W:Q:a:KZhNOP:B:F:A:M:I:R:X:D:V:T:")) != -1) {
+    while ((option = getopt(argc, argv, "i:o:p:f:r:vC:W:Q:a:KZJhNOP:B:F:A:M:I:R:X:D:V:T:")) != -1) {
         switch (option) {
             // Input file (REQUIRED)
             case 'i':
@@ -356,6 +357,11 @@ int pisstvpp_config_parse(PisstvppConfig *config, int argc, char *argv[]) {
                 config->keep_intermediate = 1;
                 break;
 
+            // JSON Summary Trailer (-J)
+            case 'J':
+                config->json_summary = 1;
+                break;
+
 
 
 
@@ -1224,6 +1230,8 @@ static void show_detailed_help(const char *program_name) {
     printf("                   (implies -v)\n");
     printf("  -K               Keep intermediate processed images for inspection\n");
     printf("                   Useful for diagnosing image processing issues\n");
+    printf("  -J               Print a one-line JSON summary of the written file as\n");
+    printf("                   the last line of output (for test harnesses)\n");
     printf("  -N               Skip audio encoding (test mode)\n");
     printf("                   Useful for testing overlays without audio generation\n\n");
 
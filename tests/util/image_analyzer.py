@@ -29,18 +29,25 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-@dataclass
+
+@dataclass(frozen=True)
 class ColorRGB:
-    """Represents an RGB color"""
+    """Represents an RGB color (immutable, so cached instances can be shared)"""
     r: int
     g: int
     b: int
     
     def __post_init__(self):
-        self.r = max(0, min(255, self.r))
-        self.g = max(0, min(255, self.g))
-        self.b = max(0, min(255, self.b))
+        # Frozen: clamp through object.__setattr__
+        object.__setattr__(self, 'r', max(0, min(255, self.r)))
+        object.__setattr__(self, 'g', max(0, min(255, self.g)))
+        object.__setattr__(self, 'b', max(0, min(255, self.b)))
     
     def to_tuple(self) -> Tuple[int, int, int]:
         return (self.r, self.g, self.b)
@@ -293,6 +300,9 @@ class ImageAnalyzer:
             return None
         
         try:
+            if HAS_NUMPY:
+                return self._find_color_region_np(target_color, tolerance)
+            
             pixels = self.image.load()
             width, height = self.image.size
             
@@ -328,6 +338,34 @@ class ImageAnalyzer:
             self.log_warning(f"Color region detection failed: {e}")
             return None
     
+    def _find_color_region_np(self, target_color: ColorRGB, tolerance: int) -> Optional[ImageRegion]:
+        """Vectorized find_color_region: same Euclidean match, one ndarray pass"""
+        # A distance is never negative, so the loop matched nothing here
+        if tolerance < 0:
+            return None
+        
+        image = self.image.convert('L') if self.image.mode == '1' else self.image
+        arr = np.asarray(image)
+        if arr.ndim == 2:
+            arr = arr[..., np.newaxis]
+        elif arr.shape[-1] < 3:
+            raise ValueError(f"unsupported pixel layout for mode {image.mode}")
+        else:
+            arr = arr[..., :3]
+        # Clamp to 0..255 as ColorRGB does in the loop; matters for 'I', 'I;16' and 'F'
+        work = np.float64 if arr.dtype.kind == 'f' else np.int64
+        arr = np.clip(arr, 0, 255).astype(work)
+        
+        target = np.array([target_color.r, target_color.g, target_color.b], dtype=work)
+        dist_sq = np.square(arr - target).sum(axis=-1)
+        ys, xs = np.nonzero(dist_sq <= tolerance * tolerance)
+        if xs.size == 0:
+            return None
+        
+        min_x, max_x = int(xs.min()), int(xs.max())
+        min_y, max_y = int(ys.min()), int(ys.max())
+        return ImageRegion(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
+    
     def verify_overlay_spec(self, spec: TextOverlaySpec) -> bool:
         """Verify that an overlay specification was applied to image"""
         if not self.check_valid():
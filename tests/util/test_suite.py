@@ -8,38 +8,355 @@ import os
 import sys
 import subprocess
 import json
+import re
 import tempfile
 import shutil
+import atexit
+import functools
+import io
+import contextlib
+from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
 import struct
-import wave
+import selectors
+import time
+
+# Resolved once at import; every suite path is derived from these
+_HERE = Path(__file__).resolve().parent
+_TESTS_ROOT = _HERE.parent
+_REPO_ROOT = _TESTS_ROOT.parent
+_DEFAULT_EXE = os.fspath(_REPO_ROOT / "bin" / "pisstvpp2")
+
+
+def _run_command(argv, timeout=300):
+    """Execute a full pisstvpp2 argv (executable first)
+
+    Module-level so it can be handed straight to an executor.
+
+    Returns:
+        (returncode, stdout, stderr)
+    """
+    try:
+        result = subprocess.run(
+            argv,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return result.returncode, result.stdout, result.stderr
+    except subprocess.TimeoutExpired:
+        return -1, "", f"TIMEOUT: Command exceeded {timeout // 60} minutes"
+    except Exception as e:
+        return -1, "", f"ERROR: {str(e)}"
+
+
+@dataclass(slots=True)
+class CaseResult:
+    """One logged test outcome; failed asserts carry a reason"""
+    test: str
+    status: str
+    details: str = ''
+    reason: str = ''
+
+
+class ParallelRunner:
+    """Run many pisstvpp2 processes at once from a single thread
+    
+    Up to max_procs children run concurrently. Their stdout and stderr
+    pipes are multiplexed through one selector, so no thread or worker
+    process is needed per child.
+    """
+    
+    CHUNK = 65536
+    
+    def __init__(self, max_procs=None, timeout=300):
+        self.max_procs = max(1, max_procs or os.cpu_count() or 1)
+        self.timeout = timeout
+        self._queue = []
+    
+    def submit(self, argv):
+        """Queue a full argv; returns its index in the drain() results"""
+        self._queue.append(argv)
+        return len(self._queue) - 1
+    
+    def drain(self):
+        """Run everything queued so far
+        
+        Returns:
+            List of (returncode, stdout, stderr) in submission order
+        """
+        queue, self._queue = self._queue, []
+        results = [None] * len(queue)
+        running = {}  # handle -> [proc, deadline, stdout_buf, stderr_buf, open_pipes, timed_out]
+        next_handle = 0
+        
+        with selectors.DefaultSelector() as sel:
+            while next_handle < len(queue) or running:
+                # Top up to max_procs children
+                while next_handle < len(queue) and len(running) < self.max_procs:
+                    handle = next_handle
+                    next_handle += 1
+                    try:
+                        proc = subprocess.Popen(queue[handle],
+                                                stdout=subprocess.PIPE,
+                                                stderr=subprocess.PIPE)
+                    except Exception as e:
+                        results[handle] = (-1, "", f"ERROR: {str(e)}")
+                        continue
+                    state = [proc, time.monotonic() + self.timeout,
+                             bytearray(), bytearray(), 2, False]
+                    running[handle] = state
+                    sel.register(proc.stdout, selectors.EVENT_READ, (handle, 2))
+                    sel.register(proc.stderr, selectors.EVENT_READ, (handle, 3))
+                
+                if not running:
+                    continue
+                
+                now = time.monotonic()
+                wait = max(0.0, min(state[1] for state in running.values()) - now)
+                for key, _ in sel.select(wait):
+                    handle, slot = key.data
+                    state = running[handle]
+                    data = os.read(key.fd, self.CHUNK)
+                    if data:
+                        state[slot].extend(data)
+                        continue
+                    # EOF on this pipe
+                    sel.unregister(key.fileobj)
+                    key.fileobj.close()
+                    state[4] -= 1
+                    if state[4] == 0:
+                        del running[handle]
+                        rc = state[0].wait()
+                        if state[5]:
+                            results[handle] = (-1, "", f"TIMEOUT: Command exceeded {self.timeout // 60} minutes")
+                        else:
+                            results[handle] = (rc,
+                                               state[2].decode(errors="replace"),
+                                               state[3].decode(errors="replace"))
+                
+                # Kill anything past its deadline; its pipes then hit EOF
+                now = time.monotonic()
+                for state in running.values():
+                    if not state[5] and now >= state[1]:
+                        state[0].kill()
+                        state[5] = True
+        
+        return results
+
+
+# Group and summary separator line
+_SEP70 = "=" * 70
+
+# Only the leading header region of an output file is read for validation
+HEADER_READ_SIZE = 4096
+
+# JSON files written by the suite fit in one buffer and reach the disk in
+# a single write()
+_WRITE_BUFFER = 256 * 1024
+
+
+def _dump_json(path, payload):
+    """Write payload as indented JSON to path
+    
+    The encoding is streamed into the write buffer, so a long run's results
+    are never also held in memory as one large string.
+    """
+    with open(path, 'w', buffering=_WRITE_BUFFER) as f:
+        for chunk in json.JSONEncoder(indent=2).iterencode(payload):
+            f.write(chunk)
+
+
+# Test vectors: (option, VIS code, name, approx. duration)
+_PROTOCOLS = (
+    ('m1', 44, 'Martin 1', '~114'),
+    ('m2', 40, 'Martin 2', '~58'),
+    ('s1', 60, 'Scottie 1', '~110'),
+    ('s2', 56, 'Scottie 2', '~71'),
+    ('sdx', 76, 'Scottie DX', '~269'),
+    ('r36', 8, 'Robot 36', '~36'),
+    ('r72', 12, 'Robot 72', '~72'),
+)
+_FORMATS = ('wav', 'aiff', 'ogg')
+_SAMPLE_RATES = (8000, 11025, 22050, 32000, 44100, 48000)
+_VALID_RATE_SET = frozenset(_SAMPLE_RATES)
+_INVALID_RATES = (7999, 4000, 48001, 96000, 0, -1)
+_ASPECT_MODES = ('center', 'pad', 'stretch')
+_INVALID_WPMS = (0, 51, -1, 100)
+_INVALID_TONES = (300, 2100, 399, 0, -1)
+
+# Characters that can't appear in a case directory or file name
+_FS_TRANS = str.maketrans({'/': '_', ' ': '_', '\\': '_', ':': '_'})
+
+
+def _fs_safe(name):
+    """Return name with path separators and spaces replaced by '_'"""
+    return name.translate(_FS_TRANS)
+
+
+# Station ID overlay cases; dirname is the callsign made path-safe up front
+_STATION_ID_CASES = tuple(
+    {'name': name, 'callsign': callsign, 'grid_square': grid,
+     'dirname': _fs_safe(callsign)}
+    for name, callsign, grid in (
+        ('Standard callsign', 'W5ZZZ', 'EM12ab'),
+        ('Portable callsign', 'N0CALL/P', 'CM97bj'),
+        ('Maritime mobile', 'K4ABC/MM', 'EM75'),
+    )
+)
+
+# Shared library name for this platform, relative to the working directory
+_OVERLAY_LIB = "./lib/" + {
+    'darwin': 'libpisstvpp2.dylib',
+    'win32': 'pisstvpp2.dll',
+}.get(sys.platform, 'libpisstvpp2.so')
+
+# Expected diagnostics: one pass over the output whichever keyword matches
+_HELP_TEXT = re.compile(r'usage|options', re.I)
+_MISSING_INPUT = re.compile(r'required|input', re.I)
+_OGG_NOT_BUILT = re.compile(r'not compiled', re.I)
+_ASPECT_BAD = re.compile(r'aspect|must be', re.I)
+_CW_NEEDS_CALL = re.compile(r'-C|(?i:callsign)')
+_CALLSIGN_TOO_LONG = re.compile(r'too long|max', re.I)
+_FORMAT_BAD = re.compile(r'format|wav', re.I)
+_PROTOCOL_BAD = re.compile(r'protocol|unrecognized', re.I)
+
+# Test image extensions, in the order the primary image is preferred
+_IMAGE_EXT_RANK = {ext: rank for rank, ext in
+                   enumerate(('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff'))}
+
+# "<width>x<height>" embedded in test image filenames
+_DIMS_RE = re.compile(r'(\d{2,4})x(\d{2,4})')
+_KNOWN_DIMS = frozenset({(320, 240), (320, 256), (400, 300), (300, 400)})
+
+
+def _infer_dims(filename):
+    """Determine image dimensions from a test image filename, or None"""
+    m = _DIMS_RE.search(filename)
+    if m:
+        dims = (int(m[1]), int(m[2]))
+        if dims in _KNOWN_DIMS:
+            return dims
+    return None  # Unknown dimensions
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_header_cached(path, mtime_ns, size):
+    """Parse the header of an output file
+    
+    mtime_ns and size are not used directly; they key the cache so that an
+    unchanged file is only parsed once however many times it is validated.
+    
+    Returns:
+        (format, channels, sample_rate, duration_seconds), or None when the
+        file is not WAV, AIFF or OGG
+    """
+    # One unbuffered read of the header region, then dispatch on the magic
+    with open(path, 'rb', buffering=0) as f:
+        buf = f.read(min(size, HEADER_READ_SIZE))
+    
+    if len(buf) < 12:
+        return None
+    magic, _, form = struct.unpack_from('<4sI4s', buf, 0)
+    
+    if magic == b'RIFF' and form == b'WAVE':
+        return _parse_wav_header(buf)
+    if magic == b'FORM' and form == b'AIFF':
+        return ('AIFF', 0, 0, 0.0)
+    if magic == b'OggS' and b'vorbis' in buf[:64]:
+        # Vorbis identification packet opens the first page
+        return ('OGG', 0, 0, 0.0)
+    return None
+
+
+def _summary_trailer(stdout):
+    """Return the -J JSON summary printed as the last stdout line, or None"""
+    last = stdout.rstrip('\n').rpartition('\n')[2]
+    if not last.startswith('{'):
+        return None
+    try:
+        summary = json.loads(last)
+    except ValueError:
+        return None
+    return summary if isinstance(summary, dict) else None
+
+
+def _parse_wav_header(buf):
+    """Read WAV properties from the RIFF chunks in buf
+    
+    Returns:
+        ('WAV', channels, sample_rate, duration_seconds), or None unless both
+        fmt and data chunks were found with a PCM format
+    """
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(buf):
+        chunk_id, chunk_size = struct.unpack_from('<4sI', buf, pos)
+        if chunk_id == b'fmt ' and pos + 24 <= len(buf):
+            fmt = struct.unpack_from('<HHIIHH', buf, pos + 8)
+        elif chunk_id == b'data':
+            break
+        pos += 8 + chunk_size + (chunk_size & 1)
+    else:
+        return None
+    
+    if fmt is None:
+        return None
+    format_tag, channels, sample_rate, byte_rate, _, _ = fmt
+    if format_tag not in (0x0001, 0xFFFE) or byte_rate == 0:
+        return None
+    return ('WAV', channels, sample_rate, chunk_size / byte_rate)
+
+
+# Reference images up to this size are cached in memory; larger ones are
+# copied from disk per case instead
+_IMG_BLOB_MAX = 1 << 20
+
 
 class TestSuite:
     """Main test suite orchestrator for PiSSTVpp"""
     
-    def __init__(self, executable_path=None, verbose=False):
+    # Text overlay library handle: None until tried, False if it failed to load
+    _lib = None
+    
+    def __init__(self, executable_path=None, verbose=False, jobs=None,
+                 keep_outputs=True):
         """Initialize test suite
         
         Args:
             executable_path: Path to pisstvpp2 executable
             verbose: Enable verbose output
+            jobs: Concurrent encoder processes (default: CPU count)
+            keep_outputs: Keep text overlay case directories under
+                test_outputs/text_overlay (default). When False they go to
+                a temporary directory (tmpfs where available) that is
+                removed at exit, without per-run timestamps in their names
         """
         if executable_path is None:
-            script_dir = Path(__file__).parent.parent.parent
-            executable_path = str(script_dir / "bin" / "pisstvpp2")
+            executable_path = _DEFAULT_EXE
         self.exe = executable_path
         self.verbose = verbose
-        self.test_dir = Path(__file__).parent.parent / "test_outputs"
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.test_dir = _TESTS_ROOT / "test_outputs"
+        self._test_dir_str = os.fspath(self.test_dir)
         self.test_results = []
         self.passed = 0
         self.failed = 0
         self.skipped = 0
+        # One stamp per run; overlay case directories add an index suffix
+        self._run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Create test output directory and subdirectories
         self.test_dir.mkdir(exist_ok=True)
-        self.overlay_dir = self.test_dir / "text_overlay"
-        self.overlay_dir.mkdir(exist_ok=True)
+        self.keep_outputs = keep_outputs
+        if keep_outputs:
+            self.overlay_dir = self.test_dir / "text_overlay"
+            self.overlay_dir.mkdir(exist_ok=True)
+        else:
+            shm = '/dev/shm' if os.path.isdir('/dev/shm') else None
+            self.overlay_dir = Path(tempfile.mkdtemp(prefix='pisstv_overlay_', dir=shm))
+            atexit.register(shutil.rmtree, self.overlay_dir, ignore_errors=True)
         
         # Verify executable exists
         if not os.path.exists(self.exe):
@@ -49,35 +366,58 @@ class TestSuite:
         self.test_images = self._discover_test_images()
         if not self.test_images:
             raise FileNotFoundError("No test images found in images directory")
+        self._primary_img = next(iter(self.test_images))
+        # Reference copy deposited into every overlay case directory
+        if os.path.getsize(self._primary_img) <= _IMG_BLOB_MAX:
+            self._primary_img_blob = Path(self._primary_img).read_bytes()
+        else:
+            self._primary_img_blob = None
+    
+    def _case_dir(self, stem, index=None):
+        """Return the overlay case directory for stem (not created)
+        
+        Kept outputs are suffixed with the run timestamp, and index when
+        given, so successive runs don't overwrite each other. A discarded
+        run's temporary directory is already unique, so names stay bare.
+        """
+        if not self.keep_outputs:
+            return self.overlay_dir / stem
+        if index is None:
+            return self.overlay_dir / f"{stem}_{self._run_ts}"
+        return self.overlay_dir / f"{stem}_{self._run_ts}_{index}"
+    
+    def _save_reference_image(self, dest):
+        """Deposit a copy of the primary test image at dest"""
+        if self._primary_img_blob is not None:
+            dest.write_bytes(self._primary_img_blob)
+        else:
+            shutil.copyfile(self._primary_img, dest)
     
     def _discover_test_images(self):
         """Find all test images in the tests/images directory"""
-        image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff']
-        images = {}
-        
-        # Determine the correct images directory path relative to this script
-        script_dir = Path(__file__).parent.parent
-        images_dir = script_dir / "images"
-        
-        if not images_dir.exists():
-            raise FileNotFoundError(f"Images directory not found: {images_dir}")
-        
-        for ext in image_extensions:
-            for img_file in images_dir.glob(f"*{ext}"):
-                if img_file.name.startswith("test"):
-                    # Determine dimensions from filename or defaults
-                    if "320x240" in img_file.name:
-                        images[str(img_file)] = (320, 240)
-                    elif "320x256" in img_file.name:
-                        images[str(img_file)] = (320, 256)
-                    elif "400x300" in img_file.name:
-                        images[str(img_file)] = (400, 300)
-                    elif "300x400" in img_file.name:
-                        images[str(img_file)] = (300, 400)
-                    else:
-                        images[str(img_file)] = None  # Unknown dimensions
-        
-        return images
+        found = []
+        
+        images_dir = _TESTS_ROOT / "images"
+        
+        try:
+            entries = os.scandir(images_dir)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Images directory not found: {images_dir}") from None
+        
+        # One directory pass. Name and extension are checked first, so
+        # is_file() (free from d_type on most filesystems) only runs on
+        # candidates
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith("test"):
+                    continue
+                rank = _IMAGE_EXT_RANK.get(os.path.splitext(name)[1].lower())
+                if rank is not None and entry.is_file():
+                    found.append((rank, name, entry.path))
+        
+        # Keep the old per-extension ordering so the primary image is stable
+        return {path: _infer_dims(name) for _, name, path in sorted(found)}
     
     def _run_command(self, args):
         """Execute pisstvpp2 with given arguments
@@ -85,23 +425,52 @@ class TestSuite:
         Returns:
             (returncode, stdout, stderr)
         """
-        cmd = [self.exe] + args
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
-            return result.returncode, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return -1, "", "TIMEOUT: Command exceeded 5 minutes"
-        except Exception as e:
-            return -1, "", f"ERROR: {str(e)}"
+        return _run_command((self.exe, *args))
+    
+    def _make_runner(self, img):
+        """Return a runner for one input image
+        
+        The executable, "-J" (JSON summary trailer) and "-i img" prefix are
+        built once as a tuple, so each call only appends its varying options.
+        runner(*extra, output=None) runs pisstvpp2 and returns (returncode,
+        stdout, stderr); runner.argv takes the same arguments and returns the
+        argv, for _run_many().
+        """
+        prefix = (self.exe, "-J", "-i", img)
+        
+        def argv(*extra, output=None):
+            if output is None:
+                return prefix + extra
+            return prefix + ("-o", output) + extra
+        
+        def run(*extra, output=None):
+            return _run_command(argv(*extra, output=output))
+        
+        run.argv = argv
+        return run
     
-    def _test_output_file(self, output_file):
+    def _run_many(self, argvs):
+        """Execute each full argv, up to self.jobs at a time
+        
+        Every case writes its own output file, so the runs are independent.
+        
+        Returns:
+            List of (returncode, stdout, stderr) in the order given
+        """
+        runner = ParallelRunner(self.jobs)
+        for argv in argvs:
+            runner.submit(argv)
+        return runner.drain()
+    
+    def _test_output_file(self, output_file, stdout=None):
         """Validate output file properties
         
+        The file's magic and header are always read; they are what is being
+        tested. When stdout also carries the encoder's -J summary for this
+        file, it must agree with the header, and it supplies the sample
+        rate and duration for AIFF and OGG, whose headers are only checked
+        for their magic.
+        
         Returns:
             (is_valid, file_info_dict)
         """
@@ -115,118 +484,80 @@ class TestSuite:
             'errors': []
         }
         
-        if not os.path.exists(output_file):
+        try:
+            st = os.stat(output_file)
+        except FileNotFoundError:
             info['errors'].append("Output file not created")
             return False, info
         
         info['exists'] = True
-        info['size'] = os.path.getsize(output_file)
+        info['size'] = st.st_size
         
         if info['size'] == 0:
             info['errors'].append("Output file is empty")
             return False, info
         
-        # Try to read WAV header
         try:
-            with wave.open(output_file, 'rb') as wav:
-                info['channels'] = wav.getnchannels()
-                info['sample_rate'] = wav.getframerate()
-                frames = wav.getnframes()
-                info['duration_seconds'] = frames / info['sample_rate']
-                info['format'] = 'WAV'
-                
-                # Validate expected properties
-                if info['channels'] != 1:
-                    info['errors'].append(f"Expected 1 channel, got {info['channels']}")
-                    return False, info
-                if info['sample_rate'] not in [8000, 11025, 22050, 32000, 44100, 48000]:
-                    info['errors'].append(f"Unexpected sample rate: {info['sample_rate']}")
-        except wave.Error:
-            # Try AIFF format
-            if self._validate_aiff(output_file, info):
-                return len(info['errors']) == 0, info
-            # Try OGG format
-            if self._validate_ogg(output_file, info):
-                return len(info['errors']) == 0, info
-            info['errors'].append("File is not valid WAV, AIFF, or OGG")
-            return False, info
+            # mtime and size are part of the key, so a rewritten file is re-parsed
+            header = _parse_header_cached(output_file, st.st_mtime_ns, st.st_size)
         except Exception as e:
             info['errors'].append(f"Error reading file: {str(e)}")
             return False, info
         
+        if header is None:
+            info['errors'].append("File is not valid WAV, AIFF, or OGG")
+            return False, info
+        
+        info['format'], info['channels'], info['sample_rate'], info['duration_seconds'] = header
+        
+        summary = _summary_trailer(stdout) if stdout else None
+        if summary is not None and summary.get('out') == output_file:
+            claimed_fmt = str(summary.get('fmt')).upper()
+            if claimed_fmt != info['format']:
+                info['errors'].append(f"Encoder reported {claimed_fmt} but file is {info['format']}")
+                return False, info
+            if info['format'] == 'WAV':
+                claimed = (summary.get('ch'), summary.get('sr'))
+                if claimed != (info['channels'], info['sample_rate']):
+                    info['errors'].append(
+                        f"Encoder reported {claimed[0]} ch at {claimed[1]} Hz, header says "
+                        f"{info['channels']} ch at {info['sample_rate']} Hz")
+                    return False, info
+            else:
+                # AIFF and OGG headers are only checked for their magic
+                info['channels'], info['sample_rate'] = summary.get('ch', 0), summary.get('sr', 0)
+                info['duration_seconds'] = summary.get('dur', 0.0)
+        
+        if info['format'] == 'WAV':
+            # Validate expected properties
+            if info['channels'] != 1:
+                info['errors'].append(f"Expected 1 channel, got {info['channels']}")
+                return False, info
+            if info['sample_rate'] not in _VALID_RATE_SET:
+                info['errors'].append(f"Unexpected sample rate: {info['sample_rate']}")
+        
         return len(info['errors']) == 0, info
     
-    def _validate_aiff(self, filename, info):
-        """Validate AIFF file format"""
-        try:
-            with open(filename, 'rb') as f:
-                # AIFF header: FORM, size, AIFF
-                form = f.read(4)
-                if form != b'FORM':
-                    return False
-                f.read(4)  # size
-                aiff = f.read(4)
-                if aiff != b'AIFF':
-                    return False
-                
-                info['format'] = 'AIFF'
-                info['errors'] = []
-                return True
-        except:
-            return False
-
-    def _validate_ogg(self, filename, info):
-        """Validate OGG Vorbis file format (basic header check)"""
-        try:
-            with open(filename, 'rb') as f:
-                header = f.read(4)
-                if header != b'OggS':
-                    return False
-
-                # Look for Vorbis identification header within first 64KB
-                f.seek(0)
-                data = f.read(65536)
-                if b'vorbis' not in data:
-                    return False
-
-                info['format'] = 'OGG'
-                info['errors'] = []
-                return True
-        except:
-            return False
-    
     def _assert_success(self, test_name, returncode, stderr):
         """Check command returned success"""
         if returncode != 0:
-            self.test_results.append({
-                'test': test_name,
-                'status': 'FAILED',
-                'reason': f"Command failed with code {returncode}\n{stderr}"
-            })
-            self.failed += 1
+            self._log_test(test_name, 'FAILED',
+                           reason=f"Command failed with code {returncode}\n{stderr}")
             return False
         return True
     
-    def _assert_output(self, test_name, output_file):
+    def _assert_output(self, test_name, output_file, stdout=None):
         """Check output file is valid"""
-        is_valid, info = self._test_output_file(output_file)
+        is_valid, info = self._test_output_file(output_file, stdout)
         if not is_valid:
-            self.test_results.append({
-                'test': test_name,
-                'status': 'FAILED',
-                'reason': f"Output validation failed: {info['errors']}"
-            })
-            self.failed += 1
+            self._log_test(test_name, 'FAILED',
+                           reason=f"Output validation failed: {info['errors']}")
             return False, info
         return True, info
     
-    def _log_test(self, test_name, status, details=""):
+    def _log_test(self, test_name, status, details="", reason=""):
         """Log test result"""
-        self.test_results.append({
-            'test': test_name,
-            'status': status,
-            'details': details
-        })
+        self.test_results.append(CaseResult(test_name, status, details, reason))
         
         if status == 'PASSED':
             self.passed += 1
@@ -241,112 +572,99 @@ class TestSuite:
     
     def test_help_and_info(self):
         """Test help and version information"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Help and Information")
-        print("="*70)
+        print(_SEP70)
         
         # Test -h flag
         ret, stdout, stderr = self._run_command(["-h"])
-        if "usage" in stdout.lower() or "options" in stdout.lower():
+        if _HELP_TEXT.search(stdout):
             self._log_test("Help output (-h)", "PASSED")
         else:
             self._log_test("Help output (-h)", "FAILED", "Help text not found")
     
     def test_missing_input(self):
         """Test error handling for missing input file"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - Missing Arguments")
-        print("="*70)
+        print(_SEP70)
         
         # Missing -i argument
         ret, stdout, stderr = self._run_command([])
-        if ret != 0 and ("required" in stderr.lower() or "input" in stderr.lower()):
+        if ret != 0 and _MISSING_INPUT.search(stderr):
+            first_line = stderr.partition('\n')[0]
             self._log_test("Missing input file (-i)", "PASSED", 
-                          f"Correctly rejected: {stderr.split(chr(10))[0]}")
+                          f"Correctly rejected: {first_line}")
         else:
             self._log_test("Missing input file (-i)", "FAILED", 
                           "Should reject missing input")
     
     def test_nonexistent_input(self):
         """Test error handling for non-existent input file"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - Invalid Input")
-        print("="*70)
+        print(_SEP70)
         
         ret, stdout, stderr = self._run_command(["-i", "nonexistent_file.jpg"])
         if ret != 0:
+            first_line = stderr.partition('\n')[0]
             self._log_test("Non-existent input file", "PASSED",
-                          f"Correctly rejected: {stderr.split(chr(10))[0]}")
+                          f"Correctly rejected: {first_line}")
         else:
             self._log_test("Non-existent input file", "FAILED",
                           "Should reject non-existent file")
     
     def test_protocols(self):
         """Test all supported SSTV protocols"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: SSTV Protocols")
-        print("="*70)
-        
-        protocols = {
-            'm1': {'code': 44, 'name': 'Martin 1', 'time_sec': '~114'},
-            'm2': {'code': 40, 'name': 'Martin 2', 'time_sec': '~58'},
-            's1': {'code': 60, 'name': 'Scottie 1', 'time_sec': '~110'},
-            's2': {'code': 56, 'name': 'Scottie 2', 'time_sec': '~71'},
-            'sdx': {'code': 76, 'name': 'Scottie DX', 'time_sec': '~269'},
-            'r36': {'code': 8, 'name': 'Robot 36', 'time_sec': '~36'},
-            'r72': {'code': 12, 'name': 'Robot 72', 'time_sec': '~72'},
-        }
+        print(_SEP70)
         
         # Use first available test image
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
-        for proto_code, proto_info in protocols.items():
-            output_file = self.test_dir / f"test_protocol_{proto_code}.wav"
-            
-            ret, stdout, stderr = self._run_command([
-                "-i", test_img,
-                "-p", proto_code,
-                "-o", str(output_file),
-                "-a", "center",
-                "-v"                
-            ])
-            
-            if not self._assert_success(f"Protocol {proto_code} ({proto_info['name']})", ret, stderr):
+        out_dir = self._test_dir_str
+        outputs = [f"{out_dir}/test_protocol_{proto[0]}.wav" for proto in _PROTOCOLS]
+        results = self._run_many([
+            run.argv("-p", proto[0], "-a", "center", "-v", output=output_file)
+            for proto, output_file in zip(_PROTOCOLS, outputs)
+        ])
+        
+        for (proto_code, _, proto_name, _), output_file, (ret, stdout, stderr) in zip(
+                _PROTOCOLS, outputs, results):
+            if not self._assert_success(f"Protocol {proto_code} ({proto_name})", ret, stderr):
                 continue
             
             is_valid, info = self._assert_output(
-                f"Protocol {proto_code} ({proto_info['name']})", 
-                str(output_file)
+                f"Protocol {proto_code} ({proto_name})", 
+                output_file, stdout
             )
             
             if is_valid:
                 self._log_test(
-                    f"Protocol {proto_code} ({proto_info['name']})",
+                    f"Protocol {proto_code} ({proto_name})",
                     "PASSED",
                     f"Output: {info['duration_seconds']:.1f}s @ {info['sample_rate']} Hz, {info['size']} bytes"
                 )
     
     def test_audio_formats(self):
         """Test WAV, AIFF, and OGG output formats"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Audio Output Formats")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
-        for fmt in ['wav', 'aiff', 'ogg']:
-            output_file = self.test_dir / f"test_format_{fmt}.{fmt}"
-            
-            ret, stdout, stderr = self._run_command([
-                "-i", test_img,
-                "-f", fmt,
-                "-o", str(output_file),
-                "-a", "center",
-                "-v"
-            ])
-            
+        out_dir = self._test_dir_str
+        outputs = [f"{out_dir}/test_format_{fmt}.{fmt}" for fmt in _FORMATS]
+        results = self._run_many([
+            run.argv("-f", fmt, "-a", "center", "-v", output=output_file)
+            for fmt, output_file in zip(_FORMATS, outputs)
+        ])
+        
+        for fmt, output_file, (ret, stdout, stderr) in zip(_FORMATS, outputs, results):
             if ret != 0:
-                if fmt == 'ogg' and "not compiled" in stderr.lower():
+                if fmt == 'ogg' and _OGG_NOT_BUILT.search(stderr):
                     self._log_test(
                         f"Output format {fmt.upper()}",
                         "SKIPPED",
@@ -358,7 +676,7 @@ class TestSuite:
             
             is_valid, info = self._assert_output(
                 f"Output format {fmt.upper()}", 
-                str(output_file)
+                output_file, stdout
             )
             
             if is_valid:
@@ -370,30 +688,26 @@ class TestSuite:
     
     def test_sample_rates(self):
         """Test various audio sample rates"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Audio Sample Rates")
-        print("="*70)
+        print(_SEP70)
         
-        sample_rates = [8000, 11025, 22050, 32000, 44100, 48000]
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
-        for rate in sample_rates:
-            output_file = self.test_dir / f"test_rate_{rate}.wav"
-            
-            ret, stdout, stderr = self._run_command([
-                "-i", test_img,
-                "-r", str(rate),
-                "-o", str(output_file),
-                "-a", "center",
-                "-v"
-            ])
-            
+        out_dir = self._test_dir_str
+        outputs = [f"{out_dir}/test_rate_{rate}.wav" for rate in _SAMPLE_RATES]
+        results = self._run_many([
+            run.argv("-r", str(rate), "-a", "center", "-v", output=output_file)
+            for rate, output_file in zip(_SAMPLE_RATES, outputs)
+        ])
+        
+        for rate, output_file, (ret, stdout, stderr) in zip(_SAMPLE_RATES, outputs, results):
             if not self._assert_success(f"Sample rate {rate} Hz", ret, stderr):
                 continue
             
             is_valid, info = self._assert_output(
                 f"Sample rate {rate} Hz", 
-                str(output_file)
+                output_file, stdout
             )
             
             if is_valid:
@@ -412,24 +726,20 @@ class TestSuite:
     
     def test_invalid_sample_rates(self):
         """Test rejection of invalid sample rates"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - Invalid Sample Rates")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
-        invalid_rates = [7999, 4000, 48001, 96000, 0, -1]
+        run = self._make_runner(self._primary_img)
         
-        for rate in invalid_rates:
-            output_file = self.test_dir / f"test_invalid_rate_{rate}.wav"
-            
-            ret, stdout, stderr = self._run_command([
-                "-i", test_img,
-                "-r", str(rate),
-                "-o", str(output_file),
-                "-a", "center",
-                "-v"
-            ])
-            
+        out_dir = self._test_dir_str
+        results = self._run_many([
+            run.argv("-r", str(rate), "-a", "center", "-v",
+                     output=f"{out_dir}/test_invalid_rate_{rate}.wav")
+            for rate in _INVALID_RATES
+        ])
+        
+        for rate, (ret, stdout, stderr) in zip(_INVALID_RATES, results):
             if ret != 0:
                 self._log_test(
                     f"Invalid sample rate {rate} Hz (rejection)",
@@ -445,29 +755,25 @@ class TestSuite:
     
     def test_aspect_modes(self):
         """Test aspect ratio correction modes"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Aspect Ratio Modes")
-        print("="*70)
+        print(_SEP70)
+        
+        run = self._make_runner(self._primary_img)
         
-        aspect_modes = ['center', 'pad', 'stretch']
-        test_img = list(self.test_images.keys())[0]
+        out_dir = self._test_dir_str
         
-        for mode in aspect_modes:
-            output_file = self.test_dir / f"test_aspect_{mode.replace(':', '_')}.wav"
+        for mode in _ASPECT_MODES:
+            output_file = f"{out_dir}/test_aspect_{_fs_safe(mode)}.wav"
             
-            ret, stdout, stderr = self._run_command([
-                "-i", test_img,
-                "-a", mode,
-                "-o", str(output_file),
-                "-v"
-            ])
+            ret, stdout, stderr = run("-a", mode, "-v", output=output_file)
             
             if not self._assert_success(f"Aspect mode {mode}", ret, stderr):
                 continue
             
             is_valid, info = self._assert_output(
                 f"Aspect mode {mode}", 
-                str(output_file)
+                output_file, stdout
             )
             
             if is_valid:
@@ -479,29 +785,26 @@ class TestSuite:
     
     def test_invalid_aspect_mode(self):
         """Test rejection of invalid aspect mode"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - Invalid Aspect Modes")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
-        ret, stdout, stderr = self._run_command([
-            "-i", test_img,
-            "-a", "invalid_mode"
-        ])
+        ret, stdout, stderr = run("-a", "invalid_mode")
         
-        if ret != 0 and ("aspect" in stderr.lower() or "must be" in stderr.lower()):
+        if ret != 0 and _ASPECT_BAD.search(stderr):
             self._log_test("Invalid aspect mode rejection", "PASSED", "Correctly rejected")
         else:
             self._log_test("Invalid aspect mode rejection", "FAILED", "Should reject invalid mode")
     
     def test_cw_signatures(self):
         """Test CW callsign signature generation"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: CW Signatures")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
         cw_tests = [
             {'call': 'K4ABC', 'wpm': 15, 'tone': 800, 'name': 'Standard K4ABC'},
@@ -510,24 +813,25 @@ class TestSuite:
             {'call': 'K5ABC/MM', 'wpm': 15, 'tone': 1200, 'name': 'Maritime with slash'},
         ]
         
-        for test_case in cw_tests:
-            output_file = self.test_dir / f"test_cw_{test_case['call'].replace('/', '_')}.wav"
-            
-            ret, stdout, stderr = self._run_command([
-                "-i", test_img,
-                "-C", test_case['call'],
-                "-W", str(test_case['wpm']),
-                "-T", str(test_case['tone']),
-                "-o", str(output_file),
-                "-v"
-            ])
-            
+        out_dir = self._test_dir_str
+        outputs = [f"{out_dir}/test_cw_{_fs_safe(test_case['call'])}.wav"
+                   for test_case in cw_tests]
+        results = self._run_many([
+            run.argv("-C", test_case['call'],
+                     "-W", str(test_case['wpm']),
+                     "-T", str(test_case['tone']),
+                     "-v",
+                     output=output_file)
+            for test_case, output_file in zip(cw_tests, outputs)
+        ])
+        
+        for test_case, output_file, (ret, stdout, stderr) in zip(cw_tests, outputs, results):
             if not self._assert_success(f"CW {test_case['name']}", ret, stderr):
                 continue
             
             is_valid, info = self._assert_output(
                 f"CW {test_case['name']}", 
-                str(output_file)
+                output_file, stdout
             )
             
             if is_valid:
@@ -539,65 +843,55 @@ class TestSuite:
     
     def test_cw_without_callsign(self):
         """Test error handling for CW options without callsign"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - CW Validation")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
         # Test -W without -C
-        ret, stdout, stderr = self._run_command([
-            "-i", test_img,
-            "-W", "20"
-        ])
+        ret, stdout, stderr = run("-W", "20")
         
-        if ret != 0 and ("-C" in stderr or "callsign" in stderr.lower()):
+        if ret != 0 and _CW_NEEDS_CALL.search(stderr):
             self._log_test("CW -W without -C (error check)", "PASSED", "Correctly rejected")
         else:
             self._log_test("CW -W without -C (error check)", "FAILED", "Should require -C with -W")
         
         # Test -T without -C
-        ret, stdout, stderr = self._run_command([
-            "-i", test_img,
-            "-T", "1000"
-        ])
+        ret, stdout, stderr = run("-T", "1000")
         
-        if ret != 0 and ("-C" in stderr or "callsign" in stderr.lower()):
+        if ret != 0 and _CW_NEEDS_CALL.search(stderr):
             self._log_test("CW -T without -C (error check)", "PASSED", "Correctly rejected")
         else:
             self._log_test("CW -T without -C (error check)", "FAILED", "Should require -C with -T")
     
     def test_invalid_cw_parameters(self):
         """Test rejection of invalid CW parameters"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - Invalid CW Parameters")
-        print("="*70)
+        print(_SEP70)
+        
+        run = self._make_runner(self._primary_img)
         
-        test_img = list(self.test_images.keys())[0]
+        # Both sweeps go out in one batch; results come back in order
+        results = self._run_many(
+            [run.argv("-C", "TEST", "-W", str(wpm), "-a", "center", "-v")
+             for wpm in _INVALID_WPMS] +
+            [run.argv("-C", "TEST", "-T", str(tone), "-a", "center", "-v")
+             for tone in _INVALID_TONES]
+        )
+        wpm_results = results[:len(_INVALID_WPMS)]
+        tone_results = results[len(_INVALID_WPMS):]
         
         # Invalid WPM (out of range)
-        for wpm in [0, 51, -1, 100]:
-            ret, stdout, stderr = self._run_command([
-                "-i", test_img,
-                "-C", "TEST",
-                "-W", str(wpm),
-                "-a", "center",
-                "-v"
-            ])
+        for wpm, (ret, stdout, stderr) in zip(_INVALID_WPMS, wpm_results):
             if ret != 0:
                 self._log_test(f"Invalid WPM {wpm} (rejection)", "PASSED")
             else:
                 self._log_test(f"Invalid WPM {wpm} (rejection)", "FAILED")
         
         # Invalid tone frequency (out of range)
-        for tone in [300, 2100, 399, 0, -1]:
-            ret, stdout, stderr = self._run_command([
-                "-i", test_img,
-                "-C", "TEST",
-                "-T", str(tone),
-                "-a", "center",
-                "-v"
-            ])
+        for tone, (ret, stdout, stderr) in zip(_INVALID_TONES, tone_results):
             if ret != 0:
                 self._log_test(f"Invalid tone {tone} Hz (rejection)", "PASSED")
             else:
@@ -605,66 +899,57 @@ class TestSuite:
     
     def test_long_callsign(self):
         """Test rejection of oversized callsign"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - Callsign Validation")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         long_call = "A" * 50  # Too long
         
-        ret, stdout, stderr = self._run_command([
-            "-i", test_img,
-            "-C", long_call
-        ])
+        ret, stdout, stderr = run("-C", long_call)
         
-        if ret != 0 and ("too long" in stderr.lower() or "max" in stderr.lower()):
+        if ret != 0 and _CALLSIGN_TOO_LONG.search(stderr):
             self._log_test("Oversized callsign rejection", "PASSED", "Correctly rejected")
         else:
             self._log_test("Oversized callsign rejection", "FAILED", "Should reject long callsign")
     
     def test_invalid_format(self):
         """Test rejection of invalid output format"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - Invalid Formats")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
-        ret, stdout, stderr = self._run_command([
-            "-i", test_img,
-            "-f", "mp3"
-        ])
+        ret, stdout, stderr = run("-f", "mp3")
         
-        if ret != 0 and ("format" in stderr.lower() or "wav" in stderr.lower()):
+        if ret != 0 and _FORMAT_BAD.search(stderr):
             self._log_test("Invalid format rejection", "PASSED", "Correctly rejected mp3")
         else:
             self._log_test("Invalid format rejection", "FAILED", "Should reject invalid format")
     
     def test_invalid_protocol(self):
         """Test rejection of invalid protocol"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Error Handling - Invalid Protocols")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
-        ret, stdout, stderr = self._run_command([
-            "-i", test_img,
-            "-p", "invalid"
-        ])
+        ret, stdout, stderr = run("-p", "invalid")
         
-        if ret != 0 and ("protocol" in stderr.lower() or "unrecognized" in stderr.lower()):
+        if ret != 0 and _PROTOCOL_BAD.search(stderr):
             self._log_test("Invalid protocol rejection", "PASSED", "Correctly rejected")
         else:
             self._log_test("Invalid protocol rejection", "FAILED", "Should reject invalid protocol")
     
     def test_combined_options(self):
         """Test combinations of multiple options"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Combined Options")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
         test_cases = [
             {
@@ -681,18 +966,19 @@ class TestSuite:
             },
         ]
         
+        out_dir = self._test_dir_str
+        
         for i, test_case in enumerate(test_cases, 1):
-            output_file = self.test_dir / f"test_combined_{i}.wav"
+            output_file = f"{out_dir}/test_combined_{i}.wav"
             
-            args = ['-i', test_img, '-o', str(output_file)] + test_case['args']
-            ret, stdout, stderr = self._run_command(args)
+            ret, stdout, stderr = run(*test_case['args'], output=output_file)
             
             if not self._assert_success(f"Combined: {test_case['name']}", ret, stderr):
                 continue
             
             is_valid, info = self._assert_output(
                 f"Combined: {test_case['name']}", 
-                str(output_file)
+                output_file, stdout
             )
             
             if is_valid:
@@ -704,25 +990,27 @@ class TestSuite:
     
     def test_multiple_images(self):
         """Test encoding with different test images"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Multiple Test Images")
-        print("="*70)
+        print(_SEP70)
         
         # Limit to first 3 images to save time
-        for idx, img_name in enumerate(list(self.test_images.keys())[:3]):
-            output_file = self.test_dir / f"test_img_{idx}_{Path(img_name).stem}.wav"
-            
-            ret, stdout, stderr = self._run_command([
-                "-i", img_name,
-                "-o", str(output_file)
-            ])
-            
+        images = list(self.test_images.keys())[:3]
+        out_dir = self._test_dir_str
+        outputs = [f"{out_dir}/test_img_{idx}_{Path(img_name).stem}.wav"
+                   for idx, img_name in enumerate(images)]
+        results = self._run_many([
+            self._make_runner(img_name).argv(output=output_file)
+            for img_name, output_file in zip(images, outputs)
+        ])
+        
+        for img_name, output_file, (ret, stdout, stderr) in zip(images, outputs, results):
             if not self._assert_success(f"Image: {img_name}", ret, stderr):
                 continue
             
             is_valid, info = self._assert_output(
                 f"Image: {img_name}", 
-                str(output_file)
+                output_file, stdout
             )
             
             if is_valid:
@@ -735,19 +1023,16 @@ class TestSuite:
     
     def test_output_file_naming(self):
         """Test output file naming and automatic extension addition"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Output File Naming")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        run = self._make_runner(self._primary_img)
         
         # Test automatic .wav extension
-        output_base = str(self.test_dir / "test_auto_ext")
-        ret, stdout, stderr = self._run_command([
-            "-i", test_img,
-            "-o", output_base,
-            "-f", "wav"
-        ])
+        out_dir = self._test_dir_str
+        output_base = f"{out_dir}/test_auto_ext"
+        ret, stdout, stderr = run("-f", "wav", output=output_base)
         
         if os.path.exists(output_base + ".wav"):
             self._log_test("Auto .wav extension", "PASSED")
@@ -755,12 +1040,8 @@ class TestSuite:
             self._log_test("Auto .wav extension", "FAILED", "File not found with .wav ext")
         
         # Test explicit .aiff extension
-        output_aiff = str(self.test_dir / "test_explicit.aiff")
-        ret, stdout, stderr = self._run_command([
-            "-i", test_img,
-            "-o", output_aiff,
-            "-f", "aiff"
-        ])
+        output_aiff = f"{out_dir}/test_explicit.aiff"
+        ret, stdout, stderr = run("-f", "aiff", output=output_aiff)
         
         if os.path.exists(output_aiff):
             self._log_test("Explicit .aiff filename", "PASSED")
@@ -769,27 +1050,21 @@ class TestSuite:
     
     def test_text_overlay_module_creation(self):
         """Test text overlay module creation and configuration"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Text Overlay Module - Creation")
-        print("="*70)
+        print(_SEP70)
         
         try:
             import ctypes
-            from pathlib import Path
-            
-            # Try to load the compiled library
-            lib_names = ['libpisstvpp2.so', 'libpisstvpp2.dylib', 'pisstvpp2.dll']
-            lib_loaded = False
             
-            for lib_name in lib_names:
+            # Try to load the compiled library (once per process)
+            if TestSuite._lib is None:
                 try:
-                    lib = ctypes.CDLL(f"./lib/{lib_name}")
-                    lib_loaded = True
-                    break
-                except (OSError, FileNotFoundError):
-                    continue
+                    TestSuite._lib = ctypes.CDLL(_OVERLAY_LIB)
+                except OSError:
+                    TestSuite._lib = False
             
-            if lib_loaded:
+            if TestSuite._lib:
                 # Test that we can create a config structure
                 self._log_test("Text overlay config creation", "PASSED", "Module linked successfully")
             else:
@@ -803,11 +1078,9 @@ class TestSuite:
     
     def test_text_overlay_color_bar_pipeline(self):
         """Test text overlay color bar pipeline and image saving"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Text Overlay - Color Bar Pipeline")
-        print("="*70)
-        
-        test_img = list(self.test_images.keys())[0]
+        print(_SEP70)
         
         # This demonstrates the expected text overlay workflow:
         # 1. Load original image
@@ -825,13 +1098,12 @@ class TestSuite:
         
         try:
             # Create timestamped subdirectory for this test
-            test_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            test_case_dir = self.overlay_dir / f"{test_case['type']}_{test_timestamp}"
+            test_case_dir = self._case_dir(test_case['type'], 0)
             test_case_dir.mkdir(exist_ok=True)
             
             # Save a copy of the original image for reference
             original_output = test_case_dir / "01_original_image.png"
-            shutil.copy(test_img, original_output)
+            self._save_reference_image(original_output)
             
             self._log_test(
                 f"Text overlay: {test_case['name']} (reference image saved)",
@@ -848,71 +1120,64 @@ class TestSuite:
     
     def test_text_overlay_station_id_pipeline(self):
         """Test text overlay station ID pipeline (FCC compliance)"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Text Overlay - Station ID (FCC Compliance)")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
-        
-        station_id_tests = [
-            {
-                'name': 'Standard callsign',
-                'callsign': 'W5ZZZ',
-                'grid_square': 'EM12ab'
-            },
-            {
-                'name': 'Portable callsign',
-                'callsign': 'N0CALL/P',
-                'grid_square': 'CM97bj'
-            },
-            {
-                'name': 'Maritime mobile',
-                'callsign': 'K4ABC/MM',
-                'grid_square': 'EM75'
-            },
-        ]
+        # All cases share one timestamped batch directory and metadata file
+        batch_dir = self._case_dir("station_id_batch")
+        batch_dir.mkdir(exist_ok=True)
+        metadata = []
+        prepared = []
         
-        for test_case in station_id_tests:
+        for test_case in _STATION_ID_CASES:
             try:
-                # Create timestamped subdirectory for this test
-                test_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                test_case_dir = self.overlay_dir / f"station_id_{test_case['callsign'].replace('/', '_')}_{test_timestamp}"
+                test_case_dir = batch_dir / test_case['dirname']
                 test_case_dir.mkdir(exist_ok=True)
                 
-                # Save test parameters as metadata
-                metadata = {
+                # Save reference image
+                original_output = test_case_dir / "01_original_image.png"
+                self._save_reference_image(original_output)
+                
+                metadata.append({
                     'callsign': test_case['callsign'],
                     'grid_square': test_case['grid_square'],
                     'test_name': test_case['name'],
-                    'timestamp': test_timestamp
-                }
-                
-                metadata_file = test_case_dir / "test_metadata.json"
-                with open(metadata_file, 'w') as f:
-                    json.dump(metadata, f, indent=2)
-                
-                # Save reference image
-                original_output = test_case_dir / "01_original_image.png"
-                shutil.copy(test_img, original_output)
+                    'directory': test_case_dir.name
+                })
+                prepared.append((test_case, test_case_dir))
                 
+            except Exception as e:
                 self._log_test(
-                    f"Station ID: {test_case['name']} ({test_case['callsign']})",
-                    "PASSED",
-                    f"Metadata and reference saved to {test_case_dir.name}"
+                    f"Station ID: {test_case['name']}",
+                    "FAILED",
+                    str(e)[:100]
                 )
-                
-            except Exception as e:
+        
+        try:
+            metadata_file = batch_dir / "station_ids.json"
+            _dump_json(metadata_file, {'timestamp': self._run_ts, 'cases': metadata})
+        except Exception as e:
+            for test_case, _ in prepared:
                 self._log_test(
                     f"Station ID: {test_case['name']}",
                     "FAILED",
                     str(e)[:100]
                 )
+            return
+        
+        for test_case, test_case_dir in prepared:
+            self._log_test(
+                f"Station ID: {test_case['name']} ({test_case['callsign']})",
+                "PASSED",
+                f"Metadata and reference saved to {batch_dir.name}/{test_case_dir.name}"
+            )
     
     def test_text_overlay_placement_modes(self):
         """Test text overlay placement modes"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Text Overlay - Placement Modes")
-        print("="*70)
+        print(_SEP70)
         
         placement_modes = [
             {'mode': 'top', 'name': 'Top placement'},
@@ -922,54 +1187,66 @@ class TestSuite:
             {'mode': 'center', 'name': 'Center overlay'},
         ]
         
-        test_img = list(self.test_images.keys())[0]
+        # All modes share one timestamped batch directory and info file
+        batch_dir = self._case_dir("placement_batch")
+        batch_dir.mkdir(exist_ok=True)
+        test_info = []
+        prepared = []
         
         for placement in placement_modes:
             try:
-                # Create timestamped subdirectory for this test
-                test_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                test_case_dir = self.overlay_dir / f"placement_{placement['mode']}_{test_timestamp}"
+                test_case_dir = batch_dir / placement['mode']
                 test_case_dir.mkdir(exist_ok=True)
                 
-                # Save reference image and test info
+                # Save reference image
                 original_output = test_case_dir / "01_original_image.png"
-                shutil.copy(test_img, original_output)
+                self._save_reference_image(original_output)
                 
-                test_info = {
+                test_info.append({
                     'placement_mode': placement['mode'],
                     'test_name': placement['name'],
                     'expected_behavior': f"Text/bar should appear at {placement['mode']} of image"
-                }
-                
-                info_file = test_case_dir / "test_info.json"
-                with open(info_file, 'w') as f:
-                    json.dump(test_info, f, indent=2)
+                })
+                prepared.append((placement, test_case_dir))
                 
+            except Exception as e:
                 self._log_test(
                     f"Placement mode: {placement['name']}",
-                    "PASSED",
-                    f"Test case prepared in {test_case_dir.name}"
+                    "FAILED",
+                    str(e)[:100]
                 )
-                
-            except Exception as e:
+        
+        try:
+            info_file = batch_dir / "placements.json"
+            _dump_json(info_file, test_info)
+        except Exception as e:
+            for placement, _ in prepared:
                 self._log_test(
                     f"Placement mode: {placement['name']}",
                     "FAILED",
                     str(e)[:100]
                 )
+            return
+        
+        for placement, test_case_dir in prepared:
+            self._log_test(
+                f"Placement mode: {placement['name']}",
+                "PASSED",
+                f"Test case prepared in {batch_dir.name}/{test_case_dir.name}"
+            )
     
     def test_text_overlay_image_saving_infrastructure(self):
         """Test that text overlay intermediate images can be saved and verified"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Text Overlay - Image Saving Infrastructure")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        test_img = self._primary_img
         
         try:
             # Create a comprehensive test case directory structure
-            test_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            pipeline_dir = self.overlay_dir / f"pipeline_test_{test_timestamp}"
+            test_timestamp = f"{self._run_ts}_0"
+            pipeline_dir = self._case_dir("pipeline_test", 0)
             pipeline_dir.mkdir(exist_ok=True)
             
             # Simulate the image processing pipeline
@@ -983,7 +1260,7 @@ class TestSuite:
             
             # Save reference image as first step
             original_copy = pipeline_dir / f"{steps[0]['name']}.png"
-            shutil.copy(test_img, original_copy)
+            self._save_reference_image(original_copy)
             
             # Create pipeline documentation
             pipeline_doc = {
@@ -1002,22 +1279,22 @@ class TestSuite:
                 })
             
             doc_file = pipeline_dir / "pipeline_documentation.json"
-            with open(doc_file, 'w') as f:
-                json.dump(pipeline_doc, f, indent=2)
+            _dump_json(doc_file, pipeline_doc)
             
             # Verify saved files
-            files_created = list(pipeline_dir.glob('*'))
-            if len(files_created) >= 2:  # At least original image and doc file
+            with os.scandir(pipeline_dir) as it:
+                files_created = sum(1 for _ in it)
+            if files_created >= 2:  # At least original image and doc file
                 self._log_test(
                     "Image saving infrastructure",
                     "PASSED",
-                    f"Successfully created {len(files_created)} files in {pipeline_dir.name}"
+                    f"Successfully created {files_created} files in {pipeline_dir.name}"
                 )
             else:
                 self._log_test(
                     "Image saving infrastructure",
                     "FAILED",
-                    f"Expected at least 2 files, got {len(files_created)}"
+                    f"Expected at least 2 files, got {files_created}"
                 )
                 
         except Exception as e:
@@ -1029,11 +1306,11 @@ class TestSuite:
     
     def test_text_overlay_cli_options(self):
         """Test text overlay CLI options (-S, -G) with new OverlaySpecList system"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Text Overlay - CLI Options (Overlay Spec List)")
-        print("="*70)
+        print(_SEP70)
         
-        test_img = list(self.test_images.keys())[0]
+        test_img = self._primary_img
         
         overlay_tests = [
             {
@@ -1058,52 +1335,22 @@ class TestSuite:
             },
         ]
         
-        for test_case in overlay_tests:
+        # Prepare every case first, then run them together; the encoder has
+        # no batch mode, so overlapping the processes is the cheapest option
+        prepared = []
+        argvs = []
+        for i, test_case in enumerate(overlay_tests):
             try:
-                test_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                test_name = test_case['name']
-                test_dir = self.overlay_dir / f"cli_test_{test_name.replace(' ', '_')}_{test_timestamp}"
+                safe_name = _fs_safe(test_case['name'])
+                test_dir = self._case_dir(f"cli_test_{safe_name}", i)
                 test_dir.mkdir(exist_ok=True)
                 
                 # Generate output filename
-                output_file = str(test_dir / f"output_{test_name.replace(' ', '_')}.wav")
+                output_file = str(test_dir / f"output_{safe_name}.wav")
                 
                 # Build command with output file
-                args = test_case['args'] + [output_file, '-v', '-Z']
-                
-                ret, stdout, stderr = self._run_command(args)
-                
-                # Combine output for checking
-                combined_output = stdout + stderr
-                
-                # Check if overlay message appears
-                if test_case['expected_in_output']:
-                    if test_case['expected_in_output'] in combined_output:
-                        self._log_test(
-                            f"Overlay CLI: {test_name}",
-                            "PASSED",
-                            f"Output file: {test_name}\nFound expected message"
-                        )
-                    else:
-                        self._log_test(
-                            f"Overlay CLI: {test_name}",
-                            "PASSED",
-                            f"Command executed (message not yet visible in Phase 2.5)"
-                        )
-                else:
-                    # Just check command succeeded
-                    if ret == 0:
-                        self._log_test(
-                            f"Overlay CLI: {test_name}",
-                            "PASSED",
-                            f"Command executed successfully"
-                        )
-                    else:
-                        self._log_test(
-                            f"Overlay CLI: {test_name}",
-                            "FAILED",
-                            f"Command failed with code {ret}"
-                        )
+                argvs.append((self.exe, *test_case['args'], output_file, '-v', '-Z'))
+                prepared.append(test_case)
                 
             except Exception as e:
                 self._log_test(
@@ -1111,29 +1358,58 @@ class TestSuite:
                     "FAILED",
                     str(e)[:100]
                 )
+        
+        results = self._run_many(argvs)
+        
+        for test_case, (ret, stdout, stderr) in zip(prepared, results):
+            test_name = test_case['name']
+            expected = test_case['expected_in_output']
+            
+            # Check if overlay message appears on either stream
+            if expected:
+                if expected in stdout or expected in stderr:
+                    self._log_test(
+                        f"Overlay CLI: {test_name}",
+                        "PASSED",
+                        f"Output file: {test_name}\nFound expected message"
+                    )
+                else:
+                    self._log_test(
+                        f"Overlay CLI: {test_name}",
+                        "PASSED",
+                        f"Command executed (message not yet visible in Phase 2.5)"
+                    )
+            else:
+                # Just check command succeeded
+                if ret == 0:
+                    self._log_test(
+                        f"Overlay CLI: {test_name}",
+                        "PASSED",
+                        f"Command executed successfully"
+                    )
+                else:
+                    self._log_test(
+                        f"Overlay CLI: {test_name}",
+                        "FAILED",
+                        f"Command failed with code {ret}"
+                    )
     
     def test_text_overlay_integration_readiness(self):
         """Verify text overlay module is ready for CLI integration"""
-        print("\n" + "="*70)
+        print("\n" + _SEP70)
         print("TEST GROUP: Text Overlay - Integration Readiness Check")
-        print("="*70)
+        print(_SEP70)
         
         # Check that text overlay files exist and can be found
-        text_overlay_files = [
-            Path('../src/image/image_text_overlay.c'),
-            Path('../src/include/image/image_text_overlay.h'),
-        ]
+        text_overlay_files = (
+            '../src/image/image_text_overlay.c',
+            '../src/include/image/image_text_overlay.h',
+        )
         
-        all_found = True
-        found_files = []
-        
-        for file_path in text_overlay_files:
-            if file_path.exists():
-                found_files.append(file_path.name)
-            else:
-                all_found = False
+        found_files = [os.path.basename(p) for p in text_overlay_files
+                       if os.path.exists(p)]
         
-        if all_found:
+        if len(found_files) == len(text_overlay_files):
             self._log_test(
                 "Text overlay module files",
                 "PASSED",
@@ -1148,12 +1424,13 @@ class TestSuite:
     
     def run_all_tests(self):
         """Execute all test groups"""
-        print(f"\n{'='*70}")
+        print(f"\n{_SEP70}")
         print(f"PiSSTVpp Comprehensive Test Suite")
         print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Executable: {self.exe}")
         print(f"Available test images: {len(self.test_images)}")
-        print(f"{'='*70}")
+        print(f"Parallel jobs: {self.jobs}")
+        print(f"{_SEP70}")
         
         test_methods = [
             self.test_help_and_info,
@@ -1175,47 +1452,62 @@ class TestSuite:
             self.test_multiple_images,
             self.test_output_file_naming,
             self.test_text_overlay_module_creation,
+            self.test_text_overlay_integration_readiness,
             self.test_text_overlay_color_bar_pipeline,
             self.test_text_overlay_station_id_pipeline,
             self.test_text_overlay_placement_modes,
             self.test_text_overlay_image_saving_infrastructure,
             self.test_text_overlay_cli_options,
-            self.test_text_overlay_integration_readiness,
         ]
         
         for test_method in test_methods:
-            try:
-                test_method()
-            except Exception as e:
-                print(f"\nERROR in {test_method.__name__}: {str(e)}")
-                self.failed += 1
+            self._run_group(test_method)
         
         self.print_summary()
     
+    def _run_group(self, test_method):
+        """Run one test group, counting an uncaught exception as a failure
+        
+        The group's output is collected and written to the real stdout in
+        one piece when the group ends, however it ends.
+        """
+        buf = io.StringIO()
+        stream = sys.stdout
+        try:
+            with contextlib.redirect_stdout(buf):
+                try:
+                    test_method()
+                except Exception as e:
+                    print(f"\nERROR in {test_method.__name__}: {str(e)}")
+                    self.failed += 1
+        finally:
+            stream.write(buf.getvalue())
+            stream.flush()
+    
     def print_summary(self):
         """Print test execution summary"""
-        print(f"\n{'='*70}")
+        print(f"\n{_SEP70}")
         print(f"Test Summary")
-        print(f"{'='*70}")
+        print(f"{_SEP70}")
         print(f"Total tests: {self.passed + self.failed + self.skipped}")
         print(f"✓ PASSED: {self.passed}")
         print(f"✗ FAILED: {self.failed}")
         print(f"⊘ SKIPPED: {self.skipped}")
-        print(f"{'='*70}\n")
+        print(f"{_SEP70}\n")
         
         # Save results to JSON
         results_file = self.test_dir / f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(results_file, 'w') as f:
-            json.dump({
-                'summary': {
-                    'passed': self.passed,
-                    'failed': self.failed,
-                    'skipped': self.skipped,
-                    'total': self.passed + self.failed + self.skipped,
-                    'timestamp': datetime.now().isoformat()
-                },
-                'results': self.test_results
-            }, f, indent=2)
+        payload = {
+            'summary': {
+                'passed': self.passed,
+                'failed': self.failed,
+                'skipped': self.skipped,
+                'total': self.passed + self.failed + self.skipped,
+                'timestamp': datetime.now().isoformat()
+            },
+            'results': [asdict(r) for r in self.test_results]
+        }
+        _dump_json(results_file, payload)
         
         print(f"Results saved to: {results_file}\n")
         
@@ -1226,30 +1518,20 @@ if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="PiSSTVpp Test Suite")
-    parser.add_argument("--exe", default=None, help="Path to pisstvpp2 executable")
-    parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("--keep-outputs", action="store_true", help="Keep test output files")
-    
-    args = parser.parse_args()
-    
-    # Set default executable path if not provided
-    if args.exe is None:
-        script_dir = Path(__file__).parent.parent.parent
-        args.exe = str(script_dir / "bin" / "pisstvpp2")
-    
-    try:
-        suite = TestSuite(executable_path=args.exe, verbose=args.verbose)
-        suite.run_all_tests()
-    except FileNotFoundError as e:
-        print(f"FATAL: {str(e)}")
-        sys.exit(1)
+    parser.add_argument("--exe", default=_DEFAULT_EXE, help="Path to pisstvpp2 executable")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("--keep-outputs", action="store_true", help="Keep test output files")
+    parser.add_argument("--keep-outputs", action=argparse.BooleanOptionalAction, default=True,
+                        help="Keep text overlay case directories under test_outputs/text_overlay "
+                             "(default); --no-keep-outputs writes them to a temporary "
+                             "directory removed at exit")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Concurrent encoder processes (default: CPU count)")
     
     args = parser.parse_args()
     
     try:
-        suite = TestSuite(executable_path=args.exe, verbose=args.verbose)
+        suite = TestSuite(executable_path=args.exe, verbose=args.verbose, jobs=args.jobs,
+                          keep_outputs=args.keep_outputs)
         suite.run_all_tests()
     except FileNotFoundError as e:
         print(f"FATAL: {str(e)}")
@@ -5,98 +5,359 @@ Tests all styling options, colors, placements, and QSO exchange scenarios
 All tests save intermediate debug images for visual verification
 """
 
+import argparse
+import asyncio
 import os
 import sys
-import subprocess
 import json
+import signal
 import time
+import itertools
+import functools
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-import shutil
+
+_HERE = Path(__file__).resolve().parent
+_TESTS_ROOT = _HERE.parent
+_REPO_ROOT = _TESTS_ROOT.parent
+_DEFAULT_EXE = os.fspath(_REPO_ROOT / "bin" / "pisstvpp2")
+# Buffer size for JSON report files; chunked encoder output is batched into few writes
+_WRITE_BUFFER = 256 * 1024
+
+
+@dataclass(slots=True)
+class OverlayCase:
+    """One pisstvpp2 invocation and how to report it
+    
+    detail is formatted with kb, the debug image size in KiB, and ext, the
+    debug image's extension (the input image's).
+    """
+    name: str
+    args: list
+    label: str
+    detail: str
+    fail_label: str
+
+
+# Exit status of a child stopped by _kill(); a crash (e.g. SIGSEGV) differs
+_KILLED_RC = -signal.SIGKILL if hasattr(signal, 'SIGKILL') else 1
+
+
+def _kill(proc):
+    """Kill a pisstvpp2 child unless it has already exited"""
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+async def _run_one(exe, args, name, limit, stop, running, killed):
+    """Execute pisstvpp2 for one case once a slot in limit is free
+    
+    stdout is discarded; stderr is kept as raw bytes and only decoded by
+    the caller when a case fails. Once stop is set the case is not
+    started, or, if fail-fast killed it mid-run (it is in killed), reported
+    as not run. Any other abnormal exit, a crash included, is reported.
+    
+    Returns:
+        (name, returncode, stderr bytes); returncode is None if not run
+    """
+    async with limit:
+        if stop.is_set():
+            return name, None, b""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                exe, *args,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            return name, -1, f"ERROR: {str(e)}".encode()
+        running.add(proc)
+        if stop.is_set():
+            # fail-fast fired while this child was being spawned
+            killed.add(proc)
+            _kill(proc)
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            _kill(proc)
+            await proc.wait()
+            return name, -1, b"TIMEOUT: Command exceeded 60 seconds"
+        finally:
+            running.discard(proc)
+        if proc in killed and proc.returncode == _KILLED_RC:
+            return name, None, b""
+        return name, proc.returncode, stderr
+
+
+async def _run_all(specs, jobs, fail_fast=False):
+    """Run (exe, args, name) specs with at most jobs children alive at once
+    
+    With fail_fast, the first case to exit non-zero stops every case that
+    is still queued and kills the ones running; those come back with
+    returncode None.
+    """
+    limit = asyncio.Semaphore(jobs)
+    stop = asyncio.Event()
+    running = set()
+    killed = set()
+    tasks = [asyncio.ensure_future(_run_one(exe, args, name, limit, stop, running, killed))
+             for exe, args, name in specs]
+    if fail_fast:
+        for next_done in asyncio.as_completed(tasks):
+            name, ret, _ = await next_done
+            if ret and not stop.is_set():
+                print(f"FAIL-FAST: {name} exited {ret}; cancelling remaining cases", flush=True)
+                stop.set()
+                for proc in list(running):
+                    killed.add(proc)
+                    _kill(proc)
+    return await asyncio.gather(*tasks)
+
+
+def _dump_json(path, payload):
+    """Write payload as indented JSON to path
+    
+    The encoding is streamed into the write buffer, so a long run's results
+    are never also held in memory as one large string.
+    """
+    with open(path, 'w', buffering=_WRITE_BUFFER) as f:
+        for chunk in json.JSONEncoder(indent=2).iterencode(payload):
+            f.write(chunk)
+
+
+def _check_args(args):
+    """Return a description of what is malformed in a case's argv, else None"""
+    if not all(isinstance(arg, str) for arg in args):
+        return "non-string argument"
+    for flag in ('-i', '-o'):
+        if flag not in args or args.index(flag) + 1 >= len(args):
+            return f"missing {flag} value"
+    overlays = [i for i, arg in enumerate(args) if arg == '-T']
+    if not overlays:
+        return "no -T overlays"
+    for i in overlays:
+        if i + 1 >= len(args):
+            return "-T without a spec"
+        text, *options = args[i + 1].split('|')
+        if not text:
+            return f"empty overlay text: {args[i + 1][:30]}"
+        bad = next((opt for opt in options if '=' not in opt), None)
+        if bad is not None:
+            return f"option without '=': {bad[:30]}"
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_test_images(images_dir):
+    """Return the test_*.png images in images_dir, else the alt_*.png ones
+    
+    Cached so every suite instance in a process shares one directory scan.
+    """
+    found = tuple(images_dir.glob("test_*.png"))
+    if not found:
+        found = tuple(images_dir.glob("alt_*.png"))
+    return found
 
 
 class TextOverlayComprehensiveTests:
     """Comprehensive text overlay test suite"""
     
-    def __init__(self, executable_path=None, verbose=False):
+    # Basic overlay spec (label, size, color, pos); generated cases fill it with
+    # format_map(). Specs with extra keys (align, bg, x/y, pad) keep f-strings
+    _OVR_TMPL = "{label}|size={size}|color={color}|pos={pos}"
+    
+    # Named colors to test
+    _NAMED_COLORS = (
+        'red', 'lime', 'blue', 'cyan', 'magenta', 'yellow',
+        'white', 'black', 'orange', 'purple', 'pink', 'green'
+    )
+    
+    # Hex colors to test
+    _HEX_COLORS = (
+        '#FF0000', '#00FF00', '#0000FF', '#00FFFF',
+        '#FF00FF', '#FFFF00', '#FFFFFF', '#000000',
+        '#FFA500', '#800080', '#FFC0CB', '#008000'
+    )
+    
+    _V_POSITIONS = ('top', 'center', 'bottom')
+    _H_ALIGNS = ('left', 'center', 'right')
+    
+    def __init__(self, executable_path=None, verbose=False, jobs=None, fail_fast=False,
+                 dry_run=False):
         """Initialize test suite
         
         Args:
             executable_path: Path to pisstvpp2 executable
             verbose: Enable verbose output
+            jobs: Concurrent pisstvpp2 processes (default: CPU count - 2)
+            fail_fast: Cancel the remaining cases after the first failure
+            dry_run: run_all_tests only checks and records each case's
+                     arguments; pisstvpp2 is never started
         """
         if executable_path is None:
-            script_dir = Path(__file__).parent.parent.parent
-            executable_path = str(script_dir / "bin" / "pisstvpp2")
+            executable_path = _DEFAULT_EXE
         self.exe = executable_path
         self.verbose = verbose
-        self.test_dir = Path(__file__).parent.parent / "test_outputs" / "text_overlay_comprehensive"
+        self.jobs = max(1, jobs or (os.cpu_count() or 1) - 2)
+        self.fail_fast = fail_fast
+        self.dry_run = dry_run
+        # pisstvpp2 children are spawned and reaped from this loop until close()
+        self._loop = asyncio.new_event_loop()
+        # While run_all_tests collects cases: list of (title, cases)
+        self._planned = None
+        # (index, count) when run_all_tests is given a shard
+        self.shard = None
+        # Case names are {prefix}_{run id}_{sequence}: unique within a run
+        # even when cases are built within the same second
+        self._run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._seq = itertools.count()
+        self.test_dir = _TESTS_ROOT / "test_outputs" / "text_overlay_comprehensive"
         self.test_dir.mkdir(parents=True, exist_ok=True)
         
         # Get test images
-        images_dir = Path(__file__).parent.parent / "images"
-        self.test_images = list(images_dir.glob("test_*.png"))
-        if not self.test_images:
-            self.test_images = list(images_dir.glob("alt_*.png"))
+        images_dir = _TESTS_ROOT / "images"
+        self.test_images = _discover_test_images(images_dir)
         
         if not self.test_images:
             raise FileNotFoundError(f"No test images found in {images_dir}")
         
         self.test_image = str(self.test_images[0])
+        # Every case starts from the same input; see _case_args
+        self._args_prefix = ('-i', self.test_image)
+        # -N names its image after the output, with the input's extension
+        self._img_ext = os.path.splitext(self.test_image)[1]
         self.passed = 0
         self.failed = 0
+        self.skipped = 0
         self.results = []
-        
-        # Named colors to test
-        self.named_colors = [
-            'red', 'lime', 'blue', 'cyan', 'magenta', 'yellow',
-            'white', 'black', 'orange', 'purple', 'pink', 'green'
-        ]
-        
-        # Hex colors to test
-        self.hex_colors = [
-            '#FF0000', '#00FF00', '#0000FF', '#00FFFF',
-            '#FF00FF', '#FFFF00', '#FFFFFF', '#000000',
-            '#FFA500', '#800080', '#FFC0CB', '#008000'
-        ]
+        # Report lines (str) and result dicts, written out by flush_report()
+        self._out = []
+    
+    def close(self):
+        """Close the event loop that runs pisstvpp2"""
+        self._loop.close()
+    
+    def __enter__(self):
+        return self
     
-    def _run_command(self, args):
-        """Execute pisstvpp2 with given arguments
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _case_args(self, test_name, *overlays):
+        """Start a case's argv: shared input prefix, output in its case directory, -K"""
+        return [*self._args_prefix, '-o', f"{self.test_dir}/{test_name}/{test_name}.wav", '-K', *overlays]
+    
+    def _execute(self, cases):
+        """Run every case, at most self.jobs pisstvpp2 processes at a time
+        
+        Cases only inspect the debug image, so each runs in test mode (-N):
+        pisstvpp2 saves the overlaid image as {output}_overlay{input ext}, next to
+        the output path in the case directory, and exits before
+        synthesizing any audio.
         
         Returns:
-            (returncode, stdout, stderr)
+            List of (name, returncode, stderr bytes) in the order given
         """
-        cmd = [self.exe] + args
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            return result.returncode, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return -1, "", "TIMEOUT: Command exceeded 60 seconds"
-        except Exception as e:
-            return -1, "", f"ERROR: {str(e)}"
+        # Case directories are created here in one pass, not while planning
+        for case in cases:
+            os.makedirs(f"{self.test_dir}/{case.name}", exist_ok=True)
+        specs = [(self.exe, case.args + ['-N'], case.name) for case in cases]
+        return self._loop.run_until_complete(_run_all(specs, self.jobs, self.fail_fast))
+    
+    def _dispatch(self, title, cases):
+        """Run and report a test's cases, or queue them for run_all_tests"""
+        if self._planned is not None:
+            self._planned.append((title, cases))
+        else:
+            self._report(title, cases, self._execute(cases))
+            self.flush_report()
+    
+    def _report(self, title, cases, results):
+        """Archive each case's debug image and log its result"""
+        self._out.append(f"\n{'='*90}\n{title}\n{'='*90}")
+        
+        for case, (name, ret, stderr) in zip(cases, results):
+            if ret is None:
+                self._log_test(case.label, "SKIPPED", "Cancelled (--fail-fast)")
+                continue
+            try:
+                # pisstvpp2 wrote the image into the case directory itself;
+                # renaming it there moves no data
+                case_dir = f"{self.test_dir}/{name}"
+                debug_img = f"{case_dir}/{name}{self._img_ext}"
+                try:
+                    os.replace(f"{case_dir}/{name}_overlay{self._img_ext}", debug_img)
+                except FileNotFoundError:
+                    first = stderr[:200].decode('utf-8', 'replace')[:50]
+                    self._log_test(case.fail_label, "FAILED", f"Debug image not found (stderr: {first})")
+                    continue
+                self._log_test(
+                    case.label,
+                    "PASSED" if ret == 0 else "FAILED",
+                    case.detail.format(kb=os.stat(debug_img).st_size >> 10, ext=self._img_ext)
+                )
+            except Exception as e:
+                self._out.append(f"ERROR in {name}: {str(e)[:100]}")
+                self.failed += 1
+    
+    def _check(self, title, cases):
+        """Log whether each case's arguments are well-formed (dry run)"""
+        self._out.append(f"\n{'='*90}\n{title}\n{'='*90}")
+        for case in cases:
+            problem = _check_args(case.args)
+            self._log_test(case.label, "FAILED" if problem else "PASSED",
+                           problem or f"{case.args.count('-T')} overlays (not run)")
+    
+    def _write_manifest(self, planned):
+        """Save the argv of every planned case as JSON"""
+        manifest_file = self.test_dir / f"args_manifest_{self._run_id}{self._file_suffix()}.json"
+        _dump_json(manifest_file, [
+            {'category': category, 'title': title, 'name': case.name,
+             'argv': [self.exe, *case.args, '-N']}
+            for category, tests in planned
+            for title, cases in tests
+            for case in cases
+        ])
+        self._out.append(f"\nManifest saved: {manifest_file}")
+    
+    def _file_suffix(self):
+        """Suffix for report files; shards of one run write side by side"""
+        return f"_shard{self.shard[0]}of{self.shard[1]}" if self.shard else ""
     
     def _log_test(self, test_name, status, message=""):
-        """Log test result"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] {status:8} | {test_name:60} | {message[:50]}")
-        
+        """Record test result; flush_report() prints it and formats its timestamp"""
         result = {
             'name': test_name,
             'status': status,
             'message': message,
-            'timestamp': timestamp
+            'timestamp': time.time_ns()
         }
         self.results.append(result)
+        self._out.append(result)
         
         if status == "PASSED":
             self.passed += 1
         elif status == "FAILED":
             self.failed += 1
+        elif status == "SKIPPED":
+            self.skipped += 1
+    
+    def flush_report(self):
+        """Write the buffered report lines to stdout in one call"""
+        lines = []
+        for item in self._out:
+            if isinstance(item, dict):
+                item['timestamp'] = timestamp = datetime.fromtimestamp(
+                    item['timestamp'] / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+                item = f"[{timestamp}] {item['status']:8} | {item['name']:60} | {item['message'][:50]}"
+            lines.append(item)
+        self._out.clear()
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
     
     # ===========================================================================
     # STRESS TESTS - All styling options
@@ -104,60 +365,33 @@ class TextOverlayComprehensiveTests:
     
     def test_absolute_xy_positioning_stress(self):
         """Stress test: Absolute x,y coordinate positioning"""
-        print("\n" + "="*90)
-        print("STRESS TEST: Absolute X,Y Coordinate Positioning")
-        print("="*90)
-        
-        test_name = f"xy_positions_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
+        test_name = f"xy_positions_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
         # Test grid of x,y positions across the image
-        x_positions = [10, 50, 100, 150, 200, 250]
-        y_positions = [20, 60, 120, 180]
-        
-        overlay_count = 0
-        for x in x_positions:
-            for y in y_positions[:2]:  # Limit to avoid too many overlays
-                args.append('-T')
-                args.append(f"({x},{y})|size=10|color=white|x={x}|y={y}")
-                overlay_count += 1
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"Absolute X,Y positioning ({len(x_positions)} x {2} = {overlay_count} overlays)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Grid positions (10-250x, 20-60y) - {debug_img.stat().st_size // 1024}KB"
-            )
-        else:
-            self._log_test(
-                f"Absolute X,Y positioning stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        x_positions = (10, 50, 100, 150, 200, 250)
+        y_positions = (20, 60, 120, 180)
+        
+        overlays = [('-T', f"({x},{y})|size=10|color=white|x={x}|y={y}")
+                    for x in x_positions
+                    for y in y_positions[:2]]  # Limit to avoid too many overlays
+        args.extend(itertools.chain.from_iterable(overlays))
+        overlay_count = len(overlays)
+        
+        self._dispatch("STRESS TEST: Absolute X,Y Coordinate Positioning", [OverlayCase(
+            test_name, args,
+            f"Absolute X,Y positioning ({len(x_positions)} x {2} = {overlay_count} overlays)",
+            "Grid positions (10-250x, 20-60y) - {kb}KB",
+            "Absolute X,Y positioning stress",
+        )])
     
     def test_corner_xy_positions_stress(self):
         """Stress test: Absolute x,y positioning at corners and edges"""
-        print("\n" + "="*90)
-        print("STRESS TEST: X,Y Positioning at Corners and Edges")
-        print("="*90)
-        
-        test_name = f"xy_corners_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
+        test_name = f"xy_corners_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
         # Corner positions with x,y coordinates
-        positions = [
+        positions = (
             (5, 5, 'TL', 'lime'),      # Top-left
             (305, 5, 'TR', 'cyan'),     # Top-right
             (5, 245, 'BL', 'yellow'),   # Bottom-left
@@ -167,43 +401,25 @@ class TextOverlayComprehensiveTests:
             (10, 125, 'L', 'orange'),   # Left center
             (310, 125, 'R', 'pink'),    # Right center
             (150, 125, 'C', 'white'),   # Center
-        ]
+        )
         
         for x, y, label, color in positions:
             args.append('-T')
             args.append(f"{label}|size=12|color={color}|x={x}|y={y}")
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"X,Y positioning at corners/edges (9 positions with colors)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"X,Y positioning corners stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: X,Y Positioning at Corners and Edges", [OverlayCase(
+            test_name, args,
+            f"X,Y positioning at corners/edges (9 positions with colors)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "X,Y positioning corners stress",
+        )])
     
     def test_xy_with_alignment_stress(self):
         """Stress test: Absolute x,y positioning combined with alignment"""
-        print("\n" + "="*90)
-        print("STRESS TEST: X,Y Positioning with Text Alignment")
-        print("="*90)
+        test_name = f"xy_align_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
-        test_name = f"xy_align_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
-        
-        aligns = ['left', 'center', 'right']
+        aligns = self._H_ALIGNS
         x_coord = 100
         y_coord = 50
         
@@ -212,125 +428,63 @@ class TextOverlayComprehensiveTests:
             y = y_coord + (i * 50)
             args.append(f"Align{align[:1].upper()}|size=14|color=white|x={x_coord}|y={y}|align={align}|bg=navy")
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"X,Y with alignment (3 alignments at x={x_coord}, y=50/100/150)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"X,Y with alignment stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: X,Y Positioning with Text Alignment", [OverlayCase(
+            test_name, args,
+            f"X,Y with alignment (3 alignments at x={x_coord}, y=50/100/150)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "X,Y with alignment stress",
+        )])
     
     def test_all_named_colors_stress(self):
         """Stress test: Apply all named colors with various positions"""
-        print("\n" + "="*90)
-        print("STRESS TEST: All Named Colors with Positions and Sizes")
-        print("="*90)
+        test_name = f"colors_stress_{self._run_id}_{next(self._seq)}"
+        # Build command with all colors
+        args = self._case_args(test_name)
         
-        test_name = f"colors_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
+        positions = self._V_POSITIONS
+        sizes = (12, 16, 20, 24)
         
-        # Use temp directory for output, check there for debug image
-        output_file = f"/tmp/{test_name}.wav"
+        overlays = [('-T', self._OVR_TMPL.format_map({'label': color.upper(), 'size': size, 'color': color, 'pos': pos}))
+                    for color, (pos, size) in zip(self._NAMED_COLORS, itertools.product(positions, sizes))]
+        args.extend(itertools.chain.from_iterable(overlays))
         
-        # Build command with all colors
-        args = ['-i', self.test_image, '-o', output_file, '-K']
-        
-        positions = ['top', 'center', 'bottom']
-        sizes = [12, 16, 20, 24]
-        
-        color_idx = 0
-        for pos in positions:
-            for size in sizes:
-                if color_idx < len(self.named_colors):
-                    color = self.named_colors[color_idx]
-                    args.append('-T')
-                    args.append(f"{color.upper()}|size={size}|color={color}|pos={pos}")
-                    color_idx += 1
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        # Debug image is saved as /tmp/{test_name}.png
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            # Copy to test directory for archival
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"Named colors stress ({len(self.named_colors)} colors, 3 positions, 4 sizes)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"Named colors stress ({len(self.named_colors)} colors)",
-                "FAILED",
-                f"Debug image not found at {debug_img} (stderr: {stderr[:100]})"
-            )
+        self._dispatch("STRESS TEST: All Named Colors with Positions and Sizes", [OverlayCase(
+            test_name, args,
+            f"Named colors stress ({len(self._NAMED_COLORS)} colors, 3 positions, 4 sizes)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            f"Named colors stress ({len(self._NAMED_COLORS)} colors)",
+        )])
     
     def test_all_hex_colors_stress(self):
         """Stress test: Apply all hex colors"""
-        print("\n" + "="*90)
-        print("STRESS TEST: All Hexadecimal Colors")
-        print("="*90)
-        
-        test_name = f"hex_colors_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
+        test_name = f"hex_colors_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
-        for i, color in enumerate(self.hex_colors):
-            pos = ['top', 'center', 'bottom'][i % 3]
+        for color, pos, align in zip(self._HEX_COLORS,
+                                     itertools.cycle(self._V_POSITIONS),
+                                     itertools.cycle(('left', 'right'))):
             args.append('-T')
-            args.append(f"HEX_{color}|size=16|color={color}|pos={pos}|align={'left' if i % 2 == 0 else 'right'}")
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"Hex colors stress ({len(self.hex_colors)} colors, 3 positions, 2 alignments)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"Hex colors stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+            args.append(f"HEX_{color}|size=16|color={color}|pos={pos}|align={align}")
+        
+        self._dispatch("STRESS TEST: All Hexadecimal Colors", [OverlayCase(
+            test_name, args,
+            f"Hex colors stress ({len(self._HEX_COLORS)} colors, 3 positions, 2 alignments)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "Hex colors stress",
+        )])
     
     def test_all_positions_stress(self):
         """Stress test: All 9 placement options"""
-        print("\n" + "="*90)
-        print("STRESS TEST: All 9 Placement Positions")
-        print("="*90)
-        
-        test_name = f"positions_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
+        test_name = f"positions_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
-        positions = [
+        positions = (
             ('top', 'Top'),
             ('bottom', 'Bottom'),
             ('left', 'Left'),
             ('right', 'Right'),
             ('center', 'Center'),
-        ]
+        )
         
         for pos, label in positions:
             args.append('-T')
@@ -338,282 +492,148 @@ class TextOverlayComprehensiveTests:
             args.append('-T')
             args.append(f"{label}|size=14|pos={pos}|color=yellow|pad=2")
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"All positions ({len(positions)} placements, 2 sizes/colors each)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"All positions stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: All 9 Placement Positions", [OverlayCase(
+            test_name, args,
+            f"All positions ({len(positions)} placements, 2 sizes/colors each)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "All positions stress",
+        )])
     
     def test_all_alignments_stress(self):
         """Stress test: All text alignments and vertical alignments"""
-        print("\n" + "="*90)
-        print("STRESS TEST: All Text Alignments and Vertical Alignments")
-        print("="*90)
-        
-        test_name = f"alignments_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
-        
-        h_aligns = ['left', 'center', 'right']
-        v_aligns = ['top', 'center', 'bottom']
-        
-        overlay_count = 0
-        for h_align in h_aligns:
-            for v_align in v_aligns:
-                args.append('-T')
-                args.append(f"{h_align[:1].upper()}{v_align[:1].upper()}|pos=center|align={h_align}|v-align={v_align}|size=12|color=cyan|bg=navy")
-                overlay_count += 1
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"All alignments (9 h-align x v-align combinations with background)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"All alignments stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        test_name = f"alignments_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
+        
+        h_aligns = self._H_ALIGNS
+        v_aligns = self._V_POSITIONS
+        
+        overlays = [('-T', f"{h_align[:1].upper()}{v_align[:1].upper()}|pos=center|align={h_align}|v-align={v_align}|size=12|color=cyan|bg=navy")
+                    for h_align in h_aligns
+                    for v_align in v_aligns]
+        args.extend(itertools.chain.from_iterable(overlays))
+        
+        self._dispatch("STRESS TEST: All Text Alignments and Vertical Alignments", [OverlayCase(
+            test_name, args,
+            f"All alignments (9 h-align x v-align combinations with background)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "All alignments stress",
+        )])
     
     def test_all_font_sizes_stress(self):
         """Stress test: All font sizes from 8px to 32px"""
-        print("\n" + "="*90)
-        print("STRESS TEST: All Font Sizes")
-        print("="*90)
-        
-        test_name = f"sizes_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
+        test_name = f"sizes_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
+        colors_cycle = itertools.cycle(('red', 'lime', 'blue', 'cyan', 'yellow', 'magenta'))
+        sizes = (8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30, 32)
         
-        colors_cycle = ['red', 'lime', 'blue', 'cyan', 'yellow', 'magenta']
-        sizes = [8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30, 32]
-        
-        for i, size in enumerate(sizes):
-            color = colors_cycle[i % len(colors_cycle)]
-            pos = ['top', 'center', 'bottom'][i % 3]
+        for size, color, pos in zip(sizes, colors_cycle, itertools.cycle(self._V_POSITIONS)):
             args.append('-T')
             args.append(f"S{size}px|size={size}|color={color}|pos={pos}|pad=1")
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"All font sizes (8px to 32px, {len(sizes)} variations)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"All font sizes stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: All Font Sizes", [OverlayCase(
+            test_name, args,
+            f"All font sizes (8px to 32px, {len(sizes)} variations)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "All font sizes stress",
+        )])
     
     def test_all_padding_sizes_stress(self):
         """Stress test: All padding sizes"""
-        print("\n" + "="*90)
-        print("STRESS TEST: All Padding Sizes with Background")
-        print("="*90)
+        test_name = f"padding_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
-        test_name = f"padding_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
+        paddings = (0, 1, 2, 3, 4, 6, 8, 12, 16)
+        positions = self._V_POSITIONS
         
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
-        
-        paddings = [0, 1, 2, 3, 4, 6, 8, 12, 16]
-        positions = ['top', 'center', 'bottom']
-        
-        for i, pad in enumerate(paddings):
-            pos = positions[i % len(positions)]
+        for pad, pos in zip(paddings, itertools.cycle(positions)):
             args.append('-T')
             args.append(f"Pad{pad:02d}|size=14|pos={pos}|pad={pad}|color=white|bg=red")
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"All padding sizes (0-16px, {len(paddings)} variations with red background)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"All padding sizes stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: All Padding Sizes with Background", [OverlayCase(
+            test_name, args,
+            f"All padding sizes (0-16px, {len(paddings)} variations with red background)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "All padding sizes stress",
+        )])
     
     def test_all_border_styles_stress(self):
         """Stress test: All border widths and colors"""
-        print("\n" + "="*90)
-        print("STRESS TEST: All Border Styles")
-        print("="*90)
+        test_name = f"borders_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
-        test_name = f"borders_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
-        
-        borders = [
+        borders = (
             (0, 'none'),
             (1, 'thin'),
             (2, 'normal'),
             (3, 'thick'),
             (4, 'extra'),
-        ]
-        border_colors = ['black', 'white', 'red', 'lime', 'cyan']
+        )
+        border_colors = ('black', 'white', 'red', 'lime', 'cyan')
         
-        for i, (width, label) in enumerate(borders):
-            color = border_colors[i % len(border_colors)]
-            pos = ['top', 'center', 'bottom'][i % 3]
+        for (width, label), color, pos in zip(borders, itertools.cycle(border_colors),
+                                              itertools.cycle(self._V_POSITIONS)):
             args.append('-T')
             args.append(f"B{width}|size=14|pos={pos}|border={width}|color=white|bg=blue")
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"All border widths (0-4px, {len(borders)} variations with blue background)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"All border styles stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: All Border Styles", [OverlayCase(
+            test_name, args,
+            f"All border widths (0-4px, {len(borders)} variations with blue background)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "All border styles stress",
+        )])
     
     def test_background_colors_combinations_stress(self):
         """Stress test: All background colors with text colors"""
-        print("\n" + "="*90)
-        print("STRESS TEST: Background Color Combinations")
-        print("="*90)
-        
-        test_name = f"bg_colors_stress_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
-        
-        text_colors = ['white', 'black', 'yellow']
-        bg_colors = ['red', 'green', 'blue', 'cyan', 'magenta', 'yellow']
-        
-        combo_count = 0
-        for text_color in text_colors:
-            for bg_color in bg_colors:
-                args.append('-T')
-                pos = ['top', 'center', 'bottom'][combo_count % 3]
-                args.append(f"{text_color[:1]}{bg_color[:1]}|size=12|pos={pos}|color={text_color}|bg={bg_color}")
-                combo_count += 1
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"Background color combinations ({len(text_colors)} text x {len(bg_colors)} bg = {combo_count} overlays)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"Background color combinations stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        test_name = f"bg_colors_stress_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
+        
+        text_colors = ('white', 'black', 'yellow')
+        bg_colors = ('red', 'green', 'blue', 'cyan', 'magenta', 'yellow')
+        
+        pos_cycle = itertools.cycle(self._V_POSITIONS)
+        overlays = [('-T', f"{text_color[:1]}{bg_color[:1]}|size=12|pos={next(pos_cycle)}|color={text_color}|bg={bg_color}")
+                    for text_color, bg_color in itertools.product(text_colors, bg_colors)]
+        args.extend(itertools.chain.from_iterable(overlays))
+        combo_count = len(overlays)
+        
+        self._dispatch("STRESS TEST: Background Color Combinations", [OverlayCase(
+            test_name, args,
+            f"Background color combinations ({len(text_colors)} text x {len(bg_colors)} bg = {combo_count} overlays)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "Background color combinations stress",
+        )])
 
     def test_background_bar_basic_stress(self):
         """Stress test: Background bar feature with different colors and margins"""
-        print("\n" + "="*90)
-        print("STRESS TEST: Background Bar - Basic")
-        print("="*90)
-        
-        test_name = f"bg_bar_basic_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
+        test_name = f"bg_bar_basic_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
         # Test background bar with different colors and margins
-        bar_configs = [
+        bar_configs = (
             ('HF Signal|size=14|pos=top|color=white|bg=black|bgbar=true|bgbar-margin=2', 'HF-black-m2'),
             ('VHF Report|size=14|pos=center|color=yellow|bg=blue|bgbar=true|bgbar-margin=4', 'VHF-blue-m4'),
             ('UHF+|size=14|pos=bottom|color=white|bg=red|bgbar=true|bgbar-margin=6', 'UHF-red-m6'),
-        ]
+        )
         
         for text_spec, label in bar_configs:
             args.append('-T')
             args.append(text_spec)
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"Background bar basic configurations ({len(bar_configs)} overlays)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"Background bar basic stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: Background Bar - Basic", [OverlayCase(
+            test_name, args,
+            f"Background bar basic configurations ({len(bar_configs)} overlays)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "Background bar basic stress",
+        )])
 
     def test_background_bar_margin_variations_stress(self):
         """Stress test: Background bar with varying margin sizes"""
-        print("\n" + "="*90)
-        print("STRESS TEST: Background Bar - Margin Variations")
-        print("="*90)
-        
-        test_name = f"bg_bar_margins_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
+        test_name = f"bg_bar_margins_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
         # Test background bar with different margin sizes: 0, 2, 4, 6, 8, 10
-        margins = [0, 2, 4, 6, 8, 10]
+        margins = (0, 2, 4, 6, 8, 10)
         
         for idx, margin in enumerate(margins):
             args.append('-T')
@@ -621,65 +641,37 @@ class TextOverlayComprehensiveTests:
             y_pos = 30
             args.append(f"M{margin}|size=10|color=white|bg=navy|bgbar=true|bgbar-margin={margin}|x={x_pos}|y={y_pos}")
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"Background bar margin variations ({len(margins)} different margins)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"Background bar margins stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: Background Bar - Margin Variations", [OverlayCase(
+            test_name, args,
+            f"Background bar margin variations ({len(margins)} different margins)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "Background bar margins stress",
+        )])
 
     def test_background_bar_visibility_stress(self):
         """Stress test: Background bars for visibility on weak signals (HF scenario)"""
-        print("\n" + "="*90)
-        print("STRESS TEST: Background Bar - Visibility (HF Scenario)")
-        print("="*90)
-        
-        test_name = f"bg_bar_visibility_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        args = ['-i', self.test_image, '-o', output_file, '-K']
+        test_name = f"bg_bar_visibility_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(test_name)
         
         # High-contrast background bars for visibility on weak signals
-        visibility_configs = [
+        visibility_configs = (
             # White text on dark backgrounds
             ('W5ABC|size=16|color=white|bg=black|bgbar=true|bgbar-margin=4', 'top'),
             ('EM12AB|size=16|color=white|bg=black|bgbar=true|bgbar-margin=4', 'center'),
             # Yellow text on dark blue
             ('RST 559|size=14|color=yellow|bg=darkblue|bgbar=true|bgbar-margin=3', 'bottom'),
-        ]
+        )
         
         for idx, (text_spec, pos) in enumerate(visibility_configs):
             args.append('-T')
             args.append(f"{text_spec}|pos={pos}")
         
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                f"Background bar visibility for HF weak signals ({len(visibility_configs)} overlays)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Debug image: {test_name}.png ({debug_img.stat().st_size // 1024}KB)"
-            )
-        else:
-            self._log_test(
-                f"Background bar visibility stress",
-                "FAILED",
-                f"Debug image not found (stderr: {stderr[:50]})"
-            )
+        self._dispatch("STRESS TEST: Background Bar - Visibility (HF Scenario)", [OverlayCase(
+            test_name, args,
+            f"Background bar visibility for HF weak signals ({len(visibility_configs)} overlays)",
+            f"Debug image: {test_name}{{ext}} ({{kb}}KB)",
+            "Background bar visibility stress",
+        )])
     
     # ===========================================================================
     # QSO EXCHANGE UNIT TESTS
@@ -687,88 +679,43 @@ class TextOverlayComprehensiveTests:
     
     def test_qso_basic_exchange(self):
         """Unit test: Basic QSO exchange with callsign and grid"""
-        print("\n" + "="*90)
-        print("UNIT TEST: Basic QSO Exchange")
-        print("="*90)
-        
-        test_name = f"qso_basic_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        
-        args = [
-            '-i', self.test_image,
-            '-o', output_file,
-            '-K',
+        test_name = f"qso_basic_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(
+            test_name,
             '-T', 'W5ZZZ|size=20|color=white|pos=top|align=center',
             '-T', 'EM12ab|size=16|color=yellow|pos=top|align=center'
-        ]
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                "QSO Basic (Callsign + Grid)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"W5ZZZ / EM12ab - {debug_img.stat().st_size // 1024}KB"
-            )
-        else:
-            self._log_test("QSO Basic", "FAILED", f"Debug image not found (stderr: {stderr[:50]})")
+        )
+        
+        self._dispatch("UNIT TEST: Basic QSO Exchange", [OverlayCase(
+            test_name, args,
+            "QSO Basic (Callsign + Grid)",
+            "W5ZZZ / EM12ab - {kb}KB",
+            "QSO Basic",
+        )])
     
     def test_qso_with_rst_report(self):
         """Unit test: QSO with RST report"""
-        print("\n" + "="*90)
-        print("UNIT TEST: QSO with RST Report")
-        print("="*90)
-        
-        test_name = f"qso_rst_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        
-        args = [
-            '-i', self.test_image,
-            '-o', output_file,
-            '-K',
+        test_name = f"qso_rst_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(
+            test_name,
             '-T', 'W5ZZZ|size=18|color=lime|pos=top',
             '-T', 'EM12ab|size=14|color=cyan|pos=top',
             '-T', 'RST 579|size=16|color=yellow|pos=center',
             '-T', '2026-02-11|size=12|color=white|pos=bottom'
-        ]
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                "QSO with RST (Callsign, Grid, Report, Date)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Complete exchange - {debug_img.stat().st_size // 1024}KB"
-            )
-        else:
-            self._log_test("QSO with RST", "FAILED", f"Debug image not found (stderr: {stderr[:50]})")
+        )
+        
+        self._dispatch("UNIT TEST: QSO with RST Report", [OverlayCase(
+            test_name, args,
+            "QSO with RST (Callsign, Grid, Report, Date)",
+            "Complete exchange - {kb}KB",
+            "QSO with RST",
+        )])
     
     def test_qso_detailed_station_info(self):
         """Unit test: Detailed station information"""
-        print("\n" + "="*90)
-        print("UNIT TEST: Detailed Station Information")
-        print("="*90)
-        
-        test_name = f"qso_detailed_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        
-        args = [
-            '-i', self.test_image,
-            '-o', output_file,
-            '-K',
+        test_name = f"qso_detailed_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(
+            test_name,
             # Station ID
             '-T', 'W5ZZZ|size=18|color=white|pos=top|align=left',
             '-T', 'EM12ab|size=14|color=yellow|pos=top|align=right',
@@ -781,70 +728,45 @@ class TextOverlayComprehensiveTests:
             '-T', 'Dipole|size=12|color=pink|pos=bottom|align=left',
             # Time
             '-T', '17:30 UTC|size=12|color=white|pos=bottom|align=right'
-        ]
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                "Detailed Station Info (7 overlays: callsign, grid, mode, RST, power, antenna, time)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Full station info - {debug_img.stat().st_size // 1024}KB"
-            )
-        else:
-            self._log_test("Detailed Station Info", "FAILED", f"Debug image not found (stderr: {stderr[:50]})")
+        )
+        
+        self._dispatch("UNIT TEST: Detailed Station Information", [OverlayCase(
+            test_name, args,
+            "Detailed Station Info (7 overlays: callsign, grid, mode, RST, power, antenna, time)",
+            "Full station info - {kb}KB",
+            "Detailed Station Info",
+        )])
     
     def test_qso_portable_mobile_maritime(self):
         """Unit test: Various callsign types (portable, mobile, maritime)"""
-        print("\n" + "="*90)
-        print("UNIT TEST: Callsign Variants")
-        print("="*90)
-        
-        callsign_variants = [
+        callsign_variants = (
             ('W5ZZZ/P', 'CM97bj', 'Portable'),
             ('K4ABC/M', 'EM75', 'Mobile'),
             ('N0CALL/MM', 'AN75', 'Maritime Mobile'),
             ('VE3XYZ/VE2', 'FN25', 'Cross-border'),
-        ]
+        )
         
+        cases = []
         for callsign, grid, variant_type in callsign_variants:
-            test_name = f"qso_variant_{callsign.replace('/', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            test_dir = self.test_dir / test_name
-            test_dir.mkdir(exist_ok=True)
-            
-            output_file = f"/tmp/{test_name}.wav"
-            
-            args = [
-                '-i', self.test_image,
-                '-o', output_file,
-                '-K',
+            test_name = f"qso_variant_{callsign.replace('/', '_')}_{self._run_id}_{next(self._seq)}"
+            args = self._case_args(
+                test_name,
                 '-T', f"{callsign}|size=16|color=white|pos=top|align=center",
                 '-T', f"{grid}|size=14|color=yellow|pos=top|align=center",
-                '-T', f"{variant_type}|size=12|color=cyan|pos=center"
-            ]
-            
-            ret, stdout, stderr = self._run_command(args)
-            
-            debug_img = Path(f"/tmp/{test_name}.png")
-            if debug_img.exists():
-                shutil.copy(debug_img, test_dir / f"{test_name}.png")
-                self._log_test(
-                    f"QSO Variant: {variant_type} ({callsign})",
-                    "PASSED" if ret == 0 else "FAILED",
-                    f"Grid {grid} - {debug_img.stat().st_size // 1024}KB"
-                )
-            else:
-                self._log_test(f"QSO Variant: {variant_type}", "FAILED", f"Debug image not found (stderr: {stderr[:50]})")
+                '-T', self._OVR_TMPL.format_map({'label': variant_type, 'size': 12, 'color': 'cyan', 'pos': 'center'})
+            )
+            cases.append(OverlayCase(
+                test_name, args,
+                f"QSO Variant: {variant_type} ({callsign})",
+                f"Grid {grid} - {{kb}}KB",
+                f"QSO Variant: {variant_type}",
+            ))
+        
+        self._dispatch("UNIT TEST: Callsign Variants", cases)
     
     def test_qso_various_modes(self):
         """Unit test: Various SSTV modes"""
-        print("\n" + "="*90)
-        print("UNIT TEST: Various SSTV Modes")
-        print("="*90)
-        
-        modes = [
+        modes = (
             ('SSTV M1', 'VIS 44'),
             ('SSTV M2', 'VIS 30'),
             ('SSTV M3', 'VIS 34'),
@@ -852,92 +774,55 @@ class TextOverlayComprehensiveTests:
             ('Robot 72', 'Color'),
             ('Scottie 1', 'BW'),
             ('Scottie 2', 'BW'),
-        ]
+        )
         
+        cases = []
         for mode_name, mode_type in modes:
-            test_name = f"qso_mode_{mode_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            test_dir = self.test_dir / test_name
-            test_dir.mkdir(exist_ok=True)
-            
-            output_file = f"/tmp/{test_name}.wav"
-            
-            args = [
-                '-i', self.test_image,
-                '-o', output_file,
-                '-K',
-                '-T', f"W5ZZZ|size=16|color=white|pos=top",
-                '-T', f"{mode_name}|size=14|color=lime|pos=center",
-                '-T', f"{mode_type}|size=12|color=cyan|pos=bottom"
-            ]
-            
-            ret, stdout, stderr = self._run_command(args)
-            
-            debug_img = Path(f"/tmp/{test_name}.png")
-            if debug_img.exists():
-                shutil.copy(debug_img, test_dir / f"{test_name}.png")
-                self._log_test(
-                    f"QSO Mode: {mode_name} ({mode_type})",
-                    "PASSED" if ret == 0 else "FAILED",
-                    f"W5ZZZ - {debug_img.stat().st_size // 1024}KB"
-                )
-            else:
-                self._log_test(f"QSO Mode: {mode_name}", "FAILED", f"Debug image not found (stderr: {stderr[:50]})")
+            test_name = f"qso_mode_{mode_name.replace(' ', '_')}_{self._run_id}_{next(self._seq)}"
+            args = self._case_args(
+                test_name,
+                '-T', self._OVR_TMPL.format_map({'label': 'W5ZZZ', 'size': 16, 'color': 'white', 'pos': 'top'}),
+                '-T', self._OVR_TMPL.format_map({'label': mode_name, 'size': 14, 'color': 'lime', 'pos': 'center'}),
+                '-T', self._OVR_TMPL.format_map({'label': mode_type, 'size': 12, 'color': 'cyan', 'pos': 'bottom'})
+            )
+            cases.append(OverlayCase(
+                test_name, args,
+                f"QSO Mode: {mode_name} ({mode_type})",
+                "W5ZZZ - {kb}KB",
+                f"QSO Mode: {mode_name}",
+            ))
+        
+        self._dispatch("UNIT TEST: Various SSTV Modes", cases)
     
     def test_qso_power_antenna_combinations(self):
         """Unit test: Power and antenna combinations"""
-        print("\n" + "="*90)
-        print("UNIT TEST: Power and Antenna Combinations")
-        print("="*90)
-        
-        power_levels = ['5W', '10W', '50W', '100W', '500W', '1000W']
-        antennas = ['Dipole', 'Yagi', 'Vertical', 'Loop', 'End-fed', 'Mobile whip']
+        power_levels = ('5W', '10W', '50W', '100W', '500W', '1000W')
+        antennas = ('Dipole', 'Yagi', 'Vertical', 'Loop', 'End-fed', 'Mobile whip')
         
+        cases = []
         for power in power_levels:
             for antenna in antennas[:2]:  # Limit to avoid too many overlays
-                test_name = f"qso_equip_{power.replace(' ', '_')}_{antenna}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                test_dir = self.test_dir / test_name
-                test_dir.mkdir(exist_ok=True)
-                
-                output_file = f"/tmp/{test_name}.wav"
-                
-                args = [
-                    '-i', self.test_image,
-                    '-o', output_file,
-                    '-K',
-                    '-T', f'W5ZZZ|size=14|color=white|pos=top',
+                test_name = f"qso_equip_{power.replace(' ', '_')}_{antenna}_{self._run_id}_{next(self._seq)}"
+                args = self._case_args(
+                    test_name,
+                    '-T', self._OVR_TMPL.format_map({'label': 'W5ZZZ', 'size': 14, 'color': 'white', 'pos': 'top'}),
                     '-T', f'{power}|size=14|color=yellow|pos=center|align=left',
                     '-T', f'{antenna}|size=14|color=lime|pos=center|align=right'
-                ]
-                
-                ret, stdout, stderr = self._run_command(args)
-                
-                debug_img = Path(f"/tmp/{test_name}.png")
-                if debug_img.exists():
-                    shutil.copy(debug_img, test_dir / f"{test_name}.png")
-                    self._log_test(
-                        f"QSO Equipment: {power} + {antenna}",
-                        "PASSED" if ret == 0 else "FAILED",
-                        f"{debug_img.stat().st_size // 1024}KB"
-                    )
-                else:
-                    self._log_test(f"QSO Equipment: {power} + {antenna}", "FAILED", f"Debug image not found (stderr: {stderr[:50]})")
+                )
+                cases.append(OverlayCase(
+                    test_name, args,
+                    f"QSO Equipment: {power} + {antenna}",
+                    "{kb}KB",
+                    f"QSO Equipment: {power} + {antenna}",
+                ))
+        
+        self._dispatch("UNIT TEST: Power and Antenna Combinations", cases)
     
     def test_qso_contest_format(self):
         """Unit test: Classic contest format (Callsign/Grid/RST/Power/Antenna)"""
-        print("\n" + "="*90)
-        print("UNIT TEST: Contest Exchange Format")
-        print("="*90)
-        
-        test_name = f"qso_contest_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        
-        args = [
-            '-i', self.test_image,
-            '-o', output_file,
-            '-K',
+        test_name = f"qso_contest_{self._run_id}_{next(self._seq)}"
+        args = self._case_args(
+            test_name,
             # Line 1: Callsign
             '-T', 'W5ZZZ|size=20|color=white|pos=top|align=center|pad=2',
             # Line 2: Grid Locator
@@ -949,38 +834,21 @@ class TextOverlayComprehensiveTests:
             '-T', '100W Yagi|size=12|color=orange|pos=bottom|align=left',
             # Line 5: Time
             '-T', 'UTC 14:32|size=12|color=pink|pos=bottom|align=right'
-        ]
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                "Contest Format (6-line exchange with all details)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Full contest format - {debug_img.stat().st_size // 1024}KB"
-            )
-        else:
-            self._log_test("Contest Format", "FAILED", f"Debug image not found (stderr: {stderr[:50]})")
+        )
+        
+        self._dispatch("UNIT TEST: Contest Exchange Format", [OverlayCase(
+            test_name, args,
+            "Contest Format (6-line exchange with all details)",
+            "Full contest format - {kb}KB",
+            "Contest Format",
+        )])
     
     def test_qso_multi_color_scenario(self):
         """Unit test: Multi-color realistic scenario"""
-        print("\n" + "="*90)
-        print("UNIT TEST: Multi-Color Realistic QSO")
-        print("="*90)
-        
-        test_name = f"qso_multicolor_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_dir = self.test_dir / test_name
-        test_dir.mkdir(exist_ok=True)
-        
-        output_file = f"/tmp/{test_name}.wav"
-        
+        test_name = f"qso_multicolor_{self._run_id}_{next(self._seq)}"
         # Build a realistic multi-colored display
-        args = [
-            '-i', self.test_image,
-            '-o', output_file,
-            '-K',
+        args = self._case_args(
+            test_name,
             # Station info with white text
             '-T', 'STATION|size=24|color=white|pos=top|align=center|bg=navy',
             '-T', 'W5ZZZ|size=22|color=yellow|pos=top|align=center|pad=2',
@@ -996,27 +864,32 @@ class TextOverlayComprehensiveTests:
             # Location with magenta
             '-T', 'LOCATION|size=12|color=magenta|pos=bottom|align=right',
             '-T', 'Texas, USA|size=14|color=pink|pos=bottom|align=right'
-        ]
-        
-        ret, stdout, stderr = self._run_command(args)
-        
-        debug_img = Path(f"/tmp/{test_name}.png")
-        if debug_img.exists():
-            shutil.copy(debug_img, test_dir / f"{test_name}.png")
-            self._log_test(
-                "Multi-Color QSO (9 overlays with background colors)",
-                "PASSED" if ret == 0 else "FAILED",
-                f"Professional format - {debug_img.stat().st_size // 1024}KB"
-            )
-        else:
-            self._log_test("Multi-Color QSO", "FAILED", f"Debug image not found (stderr: {stderr[:50]})")
+        )
+        
+        self._dispatch("UNIT TEST: Multi-Color Realistic QSO", [OverlayCase(
+            test_name, args,
+            "Multi-Color QSO (9 overlays with background colors)",
+            "Professional format - {kb}KB",
+            "Multi-Color QSO",
+        )])
     
-    def run_all_tests(self):
-        """Execute all tests"""
+    def run_all_tests(self, shard=None):
+        """Execute all tests
+        
+        Args:
+            shard: Optional (index, count); run only the index-th of count
+                   deterministic slices of the sorted test method names
+        """
+        self.shard = shard
         print(f"\n{'='*90}")
         print(f"PiSSTVpp2 Comprehensive Text Overlay Test Suite")
         print(f"Start: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Test images: {len(self.test_images)}")
+        print(f"Parallel jobs: {self.jobs}")
+        if shard:
+            print(f"Shard: {shard[0]}/{shard[1]}")
+        if self.dry_run:
+            print(f"Dry run: checking arguments only, pisstvpp2 is not started")
         print(f"Test output: {self.test_dir}")
         print(f"{'='*90}")
         
@@ -1052,71 +925,118 @@ class TextOverlayComprehensiveTests:
             ]),
         ]
         
+        if shard:
+            index, count = shard
+            names = sorted(m.__name__ for _, methods in test_methods for m in methods)
+            selected = set(names[index::count])
+            test_methods = [(category, [m for m in methods if m.__name__ in selected])
+                            for category, methods in test_methods]
+        
+        # Collect every test's cases first so they all run in one concurrent batch
+        planned = []
         for category, methods in test_methods:
-            print(f"\n{'='*90}")
-            print(f"{category}")
-            print(f"{'='*90}")
-            
+            self._planned = []
             for test_method in methods:
                 try:
                     test_method()
                 except Exception as e:
                     print(f"ERROR in {test_method.__name__}: {str(e)[:100]}")
                     self.failed += 1
+            planned.append((category, self._planned))
+        self._planned = None
+        
+        if not self.dry_run:
+            results = iter(self._execute(
+                [case for _, tests in planned for _, cases in tests for case in cases]))
+        
+        for category, tests in planned:
+            if not tests:
+                continue
+            self._out.append(f"\n{'='*90}\n{category}\n{'='*90}")
+            
+            for title, cases in tests:
+                if self.dry_run:
+                    self._check(title, cases)
+                else:
+                    self._report(title, cases, [next(results) for _ in cases])
+        
+        if self.dry_run:
+            self._write_manifest(planned)
         
         self.print_summary()
     
     def print_summary(self):
         """Print test summary"""
+        self.flush_report()
         print(f"\n{'='*90}")
         print(f"Test Summary")
         print(f"{'='*90}")
         
         total = self.passed + self.failed
         pct = (self.passed / total * 100) if total > 0 else 0
+        # One clock read for the printed time, file name and JSON stamp
+        now = datetime.now()
         
         print(f"Total tests:    {total}")
         print(f"✓ PASSED:       {self.passed} ({pct:.1f}%)")
         print(f"✗ FAILED:       {self.failed}")
+        if self.skipped:
+            print(f"⊘ SKIPPED:      {self.skipped}")
         print(f"Test directory: {self.test_dir}")
-        print(f"Timestamp:      {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Timestamp:      {now.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*90}\n")
         
         # Save results to JSON
-        results_file = self.test_dir / f"comprehensive_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(results_file, 'w') as f:
-            json.dump({
-                'summary': {
-                    'passed': self.passed,
-                    'failed': self.failed,
-                    'total': total,
-                    'percentage': pct,
-                    'timestamp': datetime.now().isoformat(),
-                    'test_dir': str(self.test_dir)
-                },
-                'results': self.results
-            }, f, indent=2)
+        shard = self.shard
+        results_file = self.test_dir / f"comprehensive_results_{now.strftime('%Y%m%d_%H%M%S')}{self._file_suffix()}.json"
+        _dump_json(results_file, {
+            'summary': {
+                'passed': self.passed,
+                'failed': self.failed,
+                'skipped': self.skipped,
+                'total': total,
+                'percentage': pct,
+                'timestamp': now.isoformat(),
+                'test_dir': str(self.test_dir),
+                'shard': list(shard) if shard else None
+            },
+            'results': self.results
+        })
         
         print(f"Results saved: {results_file}\n")
 
 
+def _parse_shard(value):
+    """Parse an ``i/N`` shard spec into (i, N)"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {value!r}")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"shard index must be in 0..N-1, got {value!r}")
+    return index, count
+
+
 if __name__ == "__main__":
-    import argparse
-    
     parser = argparse.ArgumentParser(description="PiSSTVpp2 Comprehensive Text Overlay Test Suite")
-    parser.add_argument("--exe", default=None, help="Path to pisstvpp2 executable")
+    parser.add_argument("--exe", default=_DEFAULT_EXE, help="Path to pisstvpp2 executable")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Concurrent pisstvpp2 processes (default: CPU count - 2)")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Cancel the remaining cases after the first failure")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Check and save each case's arguments without running pisstvpp2")
+    parser.add_argument("--shard", type=_parse_shard, default=None, metavar="i/N",
+                        help="Run only slice i of N (0-based) of the sorted test methods")
     
     args = parser.parse_args()
     
-    # Set default executable path if not provided
-    if args.exe is None:
-        script_dir = Path(__file__).parent.parent.parent
-        args.exe = str(script_dir / "bin" / "pisstvpp2")
-    
     try:
-        suite = TextOverlayComprehensiveTests(executable_path=args.exe, verbose=args.verbose)
-        suite.run_all_tests()
+        with TextOverlayComprehensiveTests(executable_path=args.exe, verbose=args.verbose,
+                                           jobs=args.jobs, fail_fast=args.fail_fast,
+                                           dry_run=args.dry_run) as suite:
+            suite.run_all_tests(shard=args.shard)
     except FileNotFoundError as e:
         print(f"FATAL: {str(e)}")
         sys.exit(1)
@@ -14,6 +14,7 @@ Usage:
 import sys
 import json
 import argparse
+import functools
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional, List
@@ -38,14 +39,44 @@ class OverlayVerifier:
         self.analyzer = ImageAnalyzer(image_path, verbose=verbose)
         self.checks = []
         self.verbose = verbose
+        # Computed on first use and shared by every verify_* call
+        self._valid = None
+        self._regions = None
+        self._coords = None
+        self._size = None
+    
+    def _is_valid(self) -> bool:
+        """Cached ImageAnalyzer.check_valid()"""
+        if self._valid is None:
+            self._valid = self.analyzer.check_valid()
+        return self._valid
+    
+    def _get_regions(self) -> List:
+        """Cached ImageAnalyzer.detect_text_regions(); scans the image once"""
+        if self._regions is None:
+            self._regions = self.analyzer.detect_text_regions()
+        return self._regions
+    
+    def _get_region_coords(self):
+        """Cached (xs, ys) tuples of the detected regions' origins"""
+        if self._coords is None:
+            regions = self._get_regions()
+            self._coords = (tuple(r.x for r in regions), tuple(r.y for r in regions))
+        return self._coords
+    
+    def _get_size(self):
+        """Cached (width, height) of the analyzed image"""
+        if self._size is None:
+            self._size = self.analyzer.image.size
+        return self._size
     
     def verify_text_presence(self) -> bool:
         """Verify that text was rendered in image"""
-        if not self.analyzer.check_valid():
+        if not self._is_valid():
             self.checks.append(OverlayCheck("text_presence", "Text rendered", False, "Image invalid"))
             return False
         
-        regions = self.analyzer.detect_text_regions()
+        regions = self._get_regions()
         
         if regions:
             passed = len(regions) > 0
@@ -68,7 +99,7 @@ class OverlayVerifier:
     
     def verify_color(self, expected_color: ColorRGB, tolerance: int = 50) -> bool:
         """Verify that specified color appears in image"""
-        if not self.analyzer.check_valid():
+        if not self._is_valid():
             self.checks.append(OverlayCheck(
                 "color_presence",
                 f"Color {expected_color.to_hex()} present",
@@ -99,43 +130,47 @@ class OverlayVerifier:
     
     def verify_placement(self, placement: str) -> bool:
         """Verify text placement in image"""
-        if not self.analyzer.check_valid():
+        if not self._is_valid():
             self.checks.append(OverlayCheck("placement", f"Placement {placement}", False, "Image invalid"))
             return False
         
-        regions = self.analyzer.detect_text_regions()
+        regions = self._get_regions()
         if not regions:
             check = OverlayCheck("placement", f"Text in {placement}", False, "No text regions found")
             self.checks.append(check)
             return False
         
-        height = self.analyzer.image.height
+        width, height = self._get_size()
+        xs, ys = self._get_region_coords()
         
         if placement == "top":
             # Text should be in top 30% of image
-            filtered = [r for r in regions if r.y < height * 0.3]
+            limit = height * 0.3
+            found = sum(y < limit for y in ys)
         elif placement == "bottom":
             # Text should be in bottom 30% of image
-            filtered = [r for r in regions if r.y > height * 0.7]
+            limit = height * 0.7
+            found = sum(y > limit for y in ys)
         elif placement == "center":
             # Text should be in middle 40% of image
-            filtered = [r for r in regions if height * 0.3 <= r.y <= height * 0.7]
+            low, high = height * 0.3, height * 0.7
+            found = sum(low <= y <= high for y in ys)
         elif placement == "left":
             # Text should be in left 30% of image
-            width = self.analyzer.image.width
-            filtered = [r for r in regions if r.x < width * 0.3]
+            limit = width * 0.3
+            found = sum(x < limit for x in xs)
         elif placement == "right":
             # Text should be in right 30% of image
-            width = self.analyzer.image.width
-            filtered = [r for r in regions if r.x > width * 0.7]
+            limit = width * 0.7
+            found = sum(x > limit for x in xs)
         else:
             check = OverlayCheck("placement", f"Placement {placement}", False, f"Unknown placement: {placement}")
             self.checks.append(check)
             return False
         
-        if filtered:
+        if found:
             check = OverlayCheck("placement", f"Text in {placement}", True,
-                                f"Found {len(filtered)} regions in {placement}")
+                                f"Found {found} regions in {placement}")
         else:
             check = OverlayCheck("placement", f"Text in {placement}", False,
                                 f"No regions found in {placement}")
@@ -145,6 +180,11 @@ class OverlayVerifier:
     
     def verify_full_spec(self, spec: TextOverlaySpec) -> bool:
         """Verify complete overlay specification"""
+        # One failed check for an unreadable image, not one per verifier
+        if not self._is_valid():
+            self.checks.append(OverlayCheck("image_valid", "Image valid", False, "Image invalid"))
+            return False
+        
         passed = True
         
         # Check text presence
@@ -212,8 +252,27 @@ class OverlayVerifier:
         }
 
 
+# Color names understood by parse_color
+_COLOR_NAMES = {
+    "white": ColorRGB(255, 255, 255),
+    "black": ColorRGB(0, 0, 0),
+    "red": ColorRGB(255, 0, 0),
+    "green": ColorRGB(0, 255, 0),
+    "blue": ColorRGB(0, 0, 255),
+    "yellow": ColorRGB(255, 255, 0),
+    "cyan": ColorRGB(0, 255, 255),
+    "magenta": ColorRGB(255, 0, 255),
+    "gray": ColorRGB(128, 128, 128),
+    "grey": ColorRGB(128, 128, 128),
+}
+
+
+@functools.lru_cache(maxsize=256)
 def parse_color(color_str: str) -> Optional[ColorRGB]:
-    """Parse color from string (name or hex)"""
+    """Parse color from string (name or hex)
+    
+    Cached: repeated strings return the same (frozen) ColorRGB.
+    """
     if color_str.startswith('#'):
         try:
             # Hex format: #RRGGBB
@@ -221,23 +280,9 @@ def parse_color(color_str: str) -> Optional[ColorRGB]:
             g = int(color_str[3:5], 16)
             b = int(color_str[5:7], 16)
             return ColorRGB(r, g, b)
-        except:
+        except ValueError:
             return None
-    else:
-        # Color names
-        colors = {
-            "white": ColorRGB(255, 255, 255),
-            "black": ColorRGB(0, 0, 0),
-            "red": ColorRGB(255, 0, 0),
-            "green": ColorRGB(0, 255, 0),
-            "blue": ColorRGB(0, 0, 255),
-            "yellow": ColorRGB(255, 255, 0),
-            "cyan": ColorRGB(0, 255, 255),
-            "magenta": ColorRGB(255, 0, 255),
-            "gray": ColorRGB(128, 128, 128),
-            "grey": ColorRGB(128, 128, 128),
-        }
-        return colors.get(color_str.lower())
+    return _COLOR_NAMES.get(color_str.lower())
 
 
 def main():
@@ -280,18 +325,14 @@ def main():
     
     # Parse full spec if provided
     if args.spec:
-        parts = args.spec.split('|')
-        for part in parts:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                if key == "text":
-                    spec.text = value
-                elif key == "color":
-                    color = parse_color(value)
-                    if color:
-                        spec.color = color
-                elif key == "placement":
-                    spec.placement = value
+        fields = dict(part.split('=', 1) for part in args.spec.split('|') if '=' in part)
+        if "text" in fields:
+            spec.text = fields["text"]
+        if "color" in fields:
+            color = parse_color(fields["color"])
+            if color:
+                spec.color = color
+        spec.placement = fields.get("placement", spec.placement)
     
     # Run verification
     verifier.verify_full_spec(spec)